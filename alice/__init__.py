@@ -1,7 +1,11 @@
+import importlib
 import os
+from typing import TYPE_CHECKING, Any, List
 
 from alice import public_api
-from alice.public_api import *
+
+if TYPE_CHECKING:
+    from alice.public_api import *
 
 ROOT_PATH = os.path.abspath(os.path.dirname(__file__))
 
@@ -9,3 +13,21 @@ with open(f"{ROOT_PATH}/VERSION") as f:
     __version__ = f.read().rstrip()
 
 __all__ = public_api.__all__
+
+_SUBMODULES = {"auth", "config", "face", "onboarding", "sandbox", "webhooks"}
+
+
+def __getattr__(name: str) -> Any:
+    # Public names are resolved lazily through public_api (PEP 562)
+    if name in __all__:
+        value = getattr(public_api, name)
+        globals()[name] = value
+        return value
+    if name in _SUBMODULES:
+        # Eager imports used to bind the subpackages as attributes, keep alice.<subpackage> working
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -15,11 +15,9 @@ DEFAULT_URL = "https://apis.alicebiometrics.com/onboarding"
 
 class Auth:
     @staticmethod
-    def from_config(config: Config) -> "Auth":
-        if config.session:
-            session = config.session
-        else:
-            session = requests.Session()
+    def from_config(config: Config, session: Union[Session, None] = None) -> "Auth":
+        if session is None:
+            session = config.session if config.session else requests.Session()
         return Auth(
             api_key=config.api_key,  # type: ignore
             session=session,
@@ -69,6 +67,10 @@ class Auth:
             A Result where if the operation is successful it returns USER_TOKEN.
             Otherwise, it returns an OnboardingError.
         """
+        token = self._auth_client.get_cached_user_token(user_id)
+        if token:
+            return Success(token)
+
         verbose = self.verbose or verbose
         response = self._auth_client.create_user_token(user_id, verbose=verbose)
 
@@ -100,6 +102,10 @@ class Auth:
             A Result where if the operation is successful it returns BACKEND_TOKEN or BACKEND_TOKEN_WITH_USER.
             Otherwise, it returns an OnboardingError.
         """
+        token = self._auth_client.get_cached_backend_token(user_id)
+        if token:
+            return Success(token)
+
         verbose = self.verbose or verbose
         response = self._auth_client.create_backend_token(user_id, verbose=verbose)
 
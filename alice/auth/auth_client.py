@@ -1,4 +1,5 @@
-from typing import Optional, Union
+import threading
+from typing import Optional, Tuple, Union
 from unittest.mock import Mock
 
 import requests
@@ -8,8 +9,9 @@ from requests import Response, Session
 from alice.auth.cached_token_stack import CachedTokenStack
 from alice.auth.token_tools import (
     get_reponse_from_token,
+    get_token_expiration,
     get_token_from_response,
-    is_valid_token,
+    is_valid_expiration,
 )
 from alice.onboarding.tools import print_intro, print_response, timeit
 
@@ -33,8 +35,9 @@ class AuthClient:
     ):
         self.url = url
         self._api_key = api_key
-        self._cached_login_token: Union[str, None] = None
-        self._cached_backend_token: Union[str, None] = None
+        self._cached_login_token: Union[Tuple[str, float], None] = None
+        self._cached_backend_token: Union[Tuple[str, float], None] = None
+        self._backend_token_lock = threading.Lock()
         self._cached_backend_token_stack = CachedTokenStack()
         self._cached_user_token_stack = CachedTokenStack()
         self.session = session
@@ -89,29 +92,50 @@ class AuthClient:
         if token:
             return get_reponse_from_token(token)
 
-        result = self._get_login_token()
-        if result.is_failure:
-            return result.value  # type: ignore
-        login_token = result.unwrap()
-        url = f"{self.url}/backend_token"
-        headers = {"Authorization": f"Bearer {login_token}"}
-        if self.use_cache:
-            headers["Cache-Control"] = "use-cache"
-        try:
-            response = self.session.get(url, headers=headers, timeout=self.timeout)
-            if response.status_code == 200:
-                self._cached_backend_token = get_token_from_response(response)
-        except requests.exceptions.Timeout:
-            response = get_response_timeout()
+        with self._backend_token_lock:
+            # Another thread may have refreshed the token while waiting for the lock
+            token = self._get_cached_backend_token()
+            if token:
+                return get_reponse_from_token(token)
+
+            result = self._get_login_token()
+            if result.is_failure:
+                return result.value  # type: ignore
+            login_token = result.unwrap()
+            url = f"{self.url}/backend_token"
+            headers = {"Authorization": f"Bearer {login_token}"}
+            if self.use_cache:
+                headers["Cache-Control"] = "use-cache"
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+                if response.status_code == 200:
+                    token = get_token_from_response(response)
+                    self._cached_backend_token = (token, get_token_expiration(token))
+            except requests.exceptions.Timeout:
+                response = get_response_timeout()
 
         print_response(response=response, verbose=verbose)
 
         return response
 
+    def get_cached_user_token(self, user_id: str) -> Union[str, None]:
+        return self._cached_user_token_stack.get(user_id)
+
+    def get_cached_backend_token(
+        self, user_id: Union[str, None] = None
+    ) -> Union[str, None]:
+        if user_id:
+            return self._cached_backend_token_stack.get(user_id)
+        return self._get_cached_backend_token()
+
     def _get_cached_backend_token(self) -> Union[str, None]:
-        if not is_valid_token(self._cached_backend_token):
+        cached_backend_token = self._cached_backend_token
+        if cached_backend_token is None:
+            return None
+        token, expiration = cached_backend_token
+        if not is_valid_expiration(expiration):
             return None
-        return self._cached_backend_token
+        return token
 
     def _create_backend_token_with_user_id(
         self, user_id: str, verbose: Optional[bool] = False
@@ -145,14 +169,19 @@ class AuthClient:
         return response
 
     def _get_login_token(self) -> Result[str, Response]:
-        if not is_valid_token(self._cached_login_token):
-            response = self._create_login_token()
-            if response.status_code == 200:
-                self._cached_login_token = get_token_from_response(response)
-                return Success(self._cached_login_token)
-            else:
-                return Failure(response)
-        return Success(self._cached_login_token)  # type: ignore
+        cached_login_token = self._cached_login_token
+        if cached_login_token is not None:
+            token, expiration = cached_login_token
+            if is_valid_expiration(expiration):
+                return Success(token)
+
+        response = self._create_login_token()
+        if response.status_code == 200:
+            token = get_token_from_response(response)
+            self._cached_login_token = (token, get_token_expiration(token))
+            return Success(token)
+        else:
+            return Failure(response)
 
     def _create_login_token(self) -> Response:
         final_url = f"{self.url}/login_token"
@@ -21,6 +21,10 @@ class AuthError(Error):
     @staticmethod
     def from_response(operation: str, response: Response) -> AuthError:
         code = response.status_code
+        if not response.content:
+            return AuthError(
+                operation=operation, code=code, message={"message": "no content"}
+            )
         try:
             message = response.json()
         except Exception:
@@ -1,17 +1,19 @@
 import sys
+import threading
 from collections import OrderedDict
-from typing import Union
+from typing import Tuple, Union
 
-from alice.auth.token_tools import is_valid_token
+from alice.auth.token_tools import get_token_expiration, is_valid_expiration
 from alice.onboarding.tools import timeit
 
 
 class CachedTokenStack:
-    _data: OrderedDict  # type: ignore
+    _data: "OrderedDict[str, Tuple[str, float]]"
 
     def __init__(self, max_size: int = 5000):
         self._data = OrderedDict()
         self._max_size = max_size
+        self._lock = threading.Lock()
 
     def __repr__(self) -> str:
         size = len(self._data)
@@ -19,16 +21,26 @@ class CachedTokenStack:
         return f"CachedTokenStack: [size={size} tokens | memory = {memory} bytes]"
 
     def add(self, user_id: str, token: str) -> None:
-        self._data[user_id] = token
+        expiration = get_token_expiration(token)
+        with self._lock:
+            self._data[user_id] = (token, expiration)
+            self._data.move_to_end(user_id)
 
     def get(self, user_id: str) -> Union[str, None]:
-        token = self._data.get(user_id)
+        with self._lock:
+            cached = self._data.get(user_id)
 
-        if token:
-            # If token exists take advantage of the saved time and clear expired tokens and keep max size.
-            self._clear_expired_tokens()
-            self._clear_if_max_size_has_been_exceeded()
-        return token  # type: ignore
+            if cached:
+                # If token exists take advantage of the saved time and clear expired tokens and keep max size.
+                self._clear_expired_tokens()
+                self._clear_if_max_size_has_been_exceeded()
+
+        if cached is None:
+            return None
+        token, expiration = cached
+        if not is_valid_expiration(expiration):
+            return None
+        return token
 
     def __len__(self) -> int:
         return len(self._data)
@@ -38,8 +50,8 @@ class CachedTokenStack:
         print(
             "-----------------------------------      CachedTokenStack     -----------------------------------------"
         )
-        for user_id, token in self._data.items():
-            print(f"{user_id} (valid={is_valid_token(token)}): {token} ")
+        for user_id, (token, expiration) in self._data.items():
+            print(f"{user_id} (valid={is_valid_expiration(expiration)}): {token} ")
         print(
             "-------------------------------------------------------------------------------------------------------"
         )
@@ -49,18 +61,18 @@ class CachedTokenStack:
         num_data = len(self._data)
 
         if num_data > 0:
-            latest_expired_token = None
-            for i, token in enumerate(reversed(list(self._data.values()))):
-                if not is_valid_token(token):
-                    latest_expired_token = token
+            latest_expired_user_id = None
+            for user_id, (_, expiration) in reversed(list(self._data.items())):
+                if not is_valid_expiration(expiration):
+                    latest_expired_user_id = user_id
                     break
 
-            if latest_expired_token:
+            if latest_expired_user_id:
                 exist_expired_tokens = True
 
                 while exist_expired_tokens:
-                    _, token = self._data.popitem(last=False)
-                    if token == latest_expired_token:
+                    user_id, _ = self._data.popitem(last=False)
+                    if user_id == latest_expired_user_id:
                         exist_expired_tokens = False
 
     def _clear_if_max_size_has_been_exceeded(self) -> None:
@@ -1,16 +1,29 @@
+import base64
+import json
 import time
 from typing import Union
 from unittest.mock import Mock
 
-import jwt
 from requests import Response
 
 
 def is_valid_token(token: Union[str, None], margin_seconds: int = 60) -> bool:
     if not token:
         return False
-    decoded_token = jwt.decode(token, options={"verify_signature": False})
-    return bool(decoded_token["exp"] > time.time() - margin_seconds)
+    return is_valid_expiration(get_token_expiration(token), margin_seconds)
+
+
+def get_token_expiration(token: str) -> float:
+    # The signature is not verified, so reading the payload segment directly is
+    # equivalent to jwt.decode(..., verify_signature=False) and much cheaper
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+
+
+def is_valid_expiration(expiration: float, margin_seconds: int = 60) -> bool:
+    # Tokens are considered expired margin_seconds before their exp so they are not rejected in flight
+    return expiration - margin_seconds > time.time()
 
 
 def get_token_from_response(response: Response) -> str:
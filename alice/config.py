@@ -6,6 +6,9 @@ from requests import Session
 
 from alice.onboarding.enums.environment import Environment
 
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 0
+
 
 class Config(BaseSettings):
     model_config = SettingsConfigDict(arbitrary_types_allowed=True, extra="allow")
@@ -20,6 +23,16 @@ class Config(BaseSettings):
         default=None, description="Timeout for every request in seconds", ge=0, le=100
     )
     send_agent: bool = Field(default=True)
+    pool_maxsize: int = Field(
+        default=DEFAULT_POOL_MAXSIZE,
+        description="Maximum number of keep-alive connections per host kept by the session created from this config",
+        ge=1,
+    )
+    max_retries: int = Field(
+        default=DEFAULT_MAX_RETRIES,
+        description="Retries of requests without body on 429, 502, 503 and 504 responses for the session created from this config",
+        ge=0,
+    )
     onboarding_url: Union[str, None] = Field(
         default="https://apis.alicebiometrics.com/onboarding"
     )
@@ -0,0 +1,27 @@
+from typing import Callable, List, Optional, TypeVar
+
+from alice.onboarding.models.device_info import DeviceInfo
+from alice.onboarding.models.user_info import UserInfo
+from alice.onboarding.tools import map_concurrently
+
+R = TypeVar("R")
+
+
+def map_users_concurrently(
+    func: Callable[[UserInfo, Optional[DeviceInfo]], R],
+    user_infos: List[UserInfo],
+    device_infos: Optional[List[DeviceInfo]] = None,
+    max_workers: int = 10,
+) -> List[R]:
+    """
+    Applies func to every (user_info, device_info) pair with map_concurrently and returns the results in the same
+    order as user_infos. device_infos, if given, must have the same length as user_infos.
+    """
+    if device_infos is not None and len(device_infos) != len(user_infos):
+        raise ValueError("device_infos must have the same length as user_infos")
+    devices: List[Optional[DeviceInfo]] = (
+        list(device_infos) if device_infos is not None else [None] * len(user_infos)
+    )
+    return map_concurrently(
+        lambda info: func(*info), list(zip(user_infos, devices)), max_workers
+    )
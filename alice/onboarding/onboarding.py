@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
 
-from meiga import Failure, Result, Success, early_return, isSuccess
+from meiga import Error, Failure, Result, Success, early_return, isSuccess
 from requests import Response, Session
 
 from alice.auth.auth import Auth
@@ -22,6 +22,7 @@ from alice.onboarding.models.request_runner import RequestRunner
 from alice.onboarding.models.user_info import UserInfo
 from alice.onboarding.onboarding_client import OnboardingClient
 from alice.onboarding.onboarding_errors import OnboardingError
+from alice.onboarding.tools import create_session, map_concurrently
 
 DEFAULT_URL = "https://apis.alicebiometrics.com/onboarding"
 
@@ -32,9 +33,11 @@ class Onboarding:
         if config.session:
             session = config.session
         else:
-            session = Session()
+            session = create_session(
+                pool_maxsize=config.pool_maxsize, max_retries=config.max_retries
+            )
         return Onboarding(
-            auth=Auth.from_config(config),
+            auth=Auth.from_config(config, session=session),
             url=config.onboarding_url,  # type: ignore
             timeout=config.timeout,
             send_agent=config.send_agent,
@@ -121,12 +124,21 @@ class Onboarding:
             Otherwise, it returns an OnboardingError or AuthError.
         """
         verbose = self.verbose or verbose
-        response = self.onboarding_client.create_user(
-            user_info=user_info,
-            device_info=device_info,
-            flow_id=flow_id,
-            verbose=verbose,
-        ).unwrap_or_return()
+        return self._user_id_from_result(
+            self.onboarding_client.create_user(
+                user_info=user_info,
+                device_info=device_info,
+                flow_id=flow_id,
+                verbose=verbose,
+            )
+        )
+
+    @staticmethod
+    @early_return
+    def _user_id_from_result(
+        result: Result[Response, Error]
+    ) -> Result[str, Union[OnboardingError, AuthError]]:
+        response = result.unwrap_or_return()
 
         if response.status_code == 200:
             return Success(response.json()["user_id"])
@@ -137,6 +149,45 @@ class Onboarding:
                 )
             )
 
+    def batch_create_users(
+        self,
+        user_infos: List[UserInfo],
+        device_infos: Optional[List[DeviceInfo]] = None,
+        flow_id: Union[str, None] = None,
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[str, Union[OnboardingError, AuthError]]]:
+        """
+        Creates several users concurrently
+        Parameters
+        ----------
+        user_infos
+            List of objects with optional values with info about each User.
+        device_infos
+            Optional list of objects with info about each User's Device. It must have the same length as user_infos.
+        flow_id
+            Optional identifier of the onboarding flow
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as user_infos, where if the operation is successful it returns a user_id.
+            Otherwise, it returns an OnboardingError or AuthError.
+        """
+        verbose = self.verbose or verbose
+        return [
+            self._user_id_from_result(result)
+            for result in self.onboarding_client.batch_create_users(
+                user_infos=user_infos,
+                device_infos=device_infos,
+                flow_id=flow_id,
+                max_workers=max_workers,
+                verbose=verbose,
+            )
+        ]
+
     @early_return
     def delete_user(
         self, user_id: str, verbose: Optional[bool] = False
@@ -391,7 +442,7 @@ class Onboarding:
     def add_selfie(
         self,
         user_id: str,
-        media_data: bytes,
+        media_data: Union[bytes, BinaryIO],
         wait_for_completion: Optional[bool] = True,
         verbose: Optional[bool] = False,
     ) -> Result[bool, Union[OnboardingError, AuthError]]:
@@ -405,7 +456,7 @@ class Onboarding:
         user_id
             User identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         wait_for_completion
             This setting specifies whether or not the request should return immediately or wait for the operation to complete before returning.
         verbose
@@ -671,7 +722,7 @@ class Onboarding:
         self,
         user_id: str,
         document_id: str,
-        media_data: bytes,
+        media_data: Union[bytes, BinaryIO],
         side: DocumentSide,
         manual: bool = False,
         source: DocumentSource = DocumentSource.file,
@@ -690,7 +741,7 @@ class Onboarding:
         document_id
             Document identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         side
             Side of the document [front, back or internal]
         manual
@@ -782,7 +833,7 @@ class Onboarding:
     def add_other_trusted_document(
         self,
         user_id: str,
-        pdf: bytes,
+        pdf: Union[bytes, BinaryIO],
         category: Optional[str] = None,
         verbose: Optional[bool] = False,
     ) -> Result[bool, Union[OnboardingError, AuthError]]:
@@ -796,7 +847,7 @@ class Onboarding:
         user_id
             User identifier
         pdf
-            Binary media data of pdf file.
+            Binary media data of pdf file (bytes or a binary file object, which is streamed).
         category
             Optional value to identify an Other Trusted Document (e.g invoice)
         verbose
@@ -1067,6 +1118,35 @@ class Onboarding:
                 )
             )
 
+    def batch_retrieve_certificates(
+        self,
+        user_ids: List[str],
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[List[Dict[str, Any]], Union[OnboardingError, AuthError]]]:
+        """
+        Returns summary info for created certificates of several users concurrently
+        Parameters
+        ----------
+        user_ids
+            List of user identifiers
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as user_ids, where if the operation is successful it returns a
+            list of dictionaries. Otherwise, it returns an OnboardingError or AuthError.
+        """
+        return map_concurrently(
+            lambda user_id: self.retrieve_certificates(
+                user_id=user_id, verbose=verbose
+            ),
+            user_ids,
+            max_workers=max_workers,
+        )
+
     @early_return
     def screening(
         self, user_id: str, detail: bool = False, verbose: Optional[bool] = False
@@ -1102,6 +1182,38 @@ class Onboarding:
                 OnboardingError.from_response(operation="screening", response=response)
             )
 
+    def batch_screening(
+        self,
+        user_ids: List[str],
+        detail: bool = False,
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[List[Dict[str, Any]], Union[OnboardingError, AuthError]]]:
+        """
+        Checks several users concurrently using different databases & lists (sanctions, PEP, etc)
+        Parameters
+        ----------
+        user_ids
+            List of user identifiers
+        detail
+            Used to select whether or not returns a summary detail
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as user_ids, where if the operation is successful it returns a
+            dictionary. Otherwise, it returns an OnboardingError or AuthError.
+        """
+        return map_concurrently(
+            lambda user_id: self.screening(
+                user_id=user_id, detail=detail, verbose=verbose
+            ),
+            user_ids,
+            max_workers=max_workers,
+        )
+
     @early_return
     def screening_monitor_add(
         self, user_id: str, verbose: Optional[bool] = False
@@ -1313,7 +1425,7 @@ class Onboarding:
 
     @early_return
     def authenticate_user(
-        self, user_id: str, media_data: bytes, verbose: bool = False
+        self, user_id: str, media_data: Union[bytes, BinaryIO], verbose: bool = False
     ) -> Result[str, Union[OnboardingError, AuthError]]:
         """
 
@@ -1324,7 +1436,7 @@ class Onboarding:
         user_id
             User identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         verbose
             Used for print service response as well as the time elapsed
 
@@ -1557,6 +1669,57 @@ class Onboarding:
                 OnboardingError.from_response(operation="download", response=response)
             )
 
+    @early_return
+    def download_to_path(
+        self,
+        user_id: str,
+        href: str,
+        path: str,
+        chunk_size: int = 1024 * 1024,
+        verbose: bool = False,
+    ) -> Result[bool, Union[OnboardingError, AuthError]]:
+        """
+
+        Downloads the binary data of a media resource into a file, streaming it by chunks
+        so the whole resource is never held in memory
+
+        Parameters
+        ----------
+        user_id
+            User identifier
+        href
+            href obtained, for example from the report
+        path
+            Path of the file where the media is written
+        chunk_size
+            Size in bytes of the chunks read from the response
+        verbose
+            Used for print service response as well as the time elapsed
+
+
+        Returns
+        -------
+            A Result where if the operation is successful it returns True.
+            Otherwise, it returns an OnboardingError or AuthError.
+        """
+        verbose = self.verbose or verbose
+        response = self.onboarding_client.download(
+            user_id=user_id, href=href, stream=True, verbose=verbose
+        ).unwrap_or_return()
+
+        with response:
+            if response.status_code != 200:
+                return Failure(
+                    OnboardingError.from_response(
+                        operation="download_to_path", response=response
+                    )
+                )
+            with open(path, "wb") as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+
+        return isSuccess
+
     @early_return
     def request_duplicates_search(
         self,
@@ -1667,6 +1830,7 @@ class Onboarding:
                 )
             )
 
+    @early_return
     def get_user_state(
         self,
         user_id: str,
@@ -1701,6 +1865,33 @@ class Onboarding:
                 )
             )
 
+    def batch_get_user_states(
+        self,
+        user_ids: List[str],
+        max_workers: int = 10,
+        verbose: bool = False,
+    ) -> List[Result[UserState, OnboardingError]]:
+        """
+        Retrieves the state of several users concurrently
+        Parameters
+        ----------
+        user_ids
+            List of user identifiers
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as user_ids, where if the operation is successful it returns the user state.
+            Otherwise, it returns an OnboardingError.
+        """
+        return map_concurrently(
+            lambda user_id: self.get_user_state(user_id=user_id, verbose=verbose),
+            user_ids,
+            max_workers=max_workers,
+        )
+
     def update_user_state(
         self,
         user_id: str,
@@ -1,7 +1,7 @@
 import json
 import platform
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
 
 import requests
 from meiga import Error, Failure, Result, Success, early_return
@@ -9,6 +9,8 @@ from requests import Response, Session
 
 import alice
 from alice.auth.auth import Auth
+from alice.config import DEFAULT_MAX_RETRIES, DEFAULT_POOL_MAXSIZE
+from alice.onboarding.batch import map_users_concurrently
 from alice.onboarding.enums.certificate_locale import CertificateLocale
 from alice.onboarding.enums.decision import Decision
 from alice.onboarding.enums.document_side import DocumentSide
@@ -22,12 +24,43 @@ from alice.onboarding.models.device_info import DeviceInfo
 from alice.onboarding.models.request_runner import RequestRunner
 from alice.onboarding.models.user_info import UserInfo
 from alice.onboarding.onboarding_errors import OnboardingError
-from alice.onboarding.tools import print_intro, print_response, print_token, timeit
+from alice.onboarding.tools import (
+    create_session,
+    map_concurrently,
+    multipart_encoder,
+    print_intro,
+    print_response,
+    print_token,
+    timeit,
+)
 
 DEFAULT_URL = "https://apis.alicebiometrics.com/onboarding"
 
 
 class OnboardingClient:
+    @classmethod
+    def with_tuned_session(
+        cls,
+        auth: Auth,
+        url: str = DEFAULT_URL,
+        timeout: Union[float, None] = None,
+        send_agent: bool = True,
+        pool_size: int = DEFAULT_POOL_MAXSIZE,
+        retries: int = DEFAULT_MAX_RETRIES,
+    ) -> "OnboardingClient":
+        """
+        Returns a client whose session keeps up to pool_size keep-alive connections
+        and retries requests without body on transient (429, 502, 503, 504) errors.
+        Defaults match the ones of Config (pool_maxsize, max_retries) used by Onboarding.from_config.
+        """
+        return cls(
+            auth=auth,
+            session=create_session(pool_maxsize=pool_size, max_retries=retries),
+            url=url,
+            timeout=timeout,
+            send_agent=send_agent,
+        )
+
     def __init__(
         self,
         auth: Auth,
@@ -41,16 +74,52 @@ class OnboardingClient:
         self.timeout = timeout
         self.send_agent = send_agent
         self.session = session
-
-    def _auth_headers(self, token: str) -> Dict[str, Any]:
-        auth_headers = {"Authorization": f"Bearer {token}"}
-        if self.send_agent:
-            auth_headers.update(
-                {
-                    "Alice-User-Agent": f"onboarding-python/{alice.__version__} ({platform.system()}; {platform.release()}) python {platform.python_version()}"
-                }
-            )
-        return auth_headers
+        self._user_agent = f"onboarding-python/{alice.__version__} ({platform.system()}; {platform.release()}) python {platform.python_version()}"
+        self._agent_headers = {"Alice-User-Agent": self._user_agent}
+        self._url_healthcheck = f"{url}/healthcheck"
+        self._url_user = f"{url}/user"
+        self._url_user_status = f"{url}/user/status"
+        self._url_users = f"{url}/users"
+        self._url_users_stats = f"{url}/users/stats"
+        self._url_users_status = f"{url}/users/status"
+        self._url_user_feedback = f"{url}/user/feedback"
+        self._url_user_selfie = f"{url}/user/selfie"
+        self._url_documents_supported = f"{url}/documents/supported"
+        self._url_user_document = f"{url}/user/document"
+        self._url_user_document_properties = f"{url}/user/document/properties"
+        self._url_user_other_trusted_document = f"{url}/user/other-trusted-document"
+        self._url_user_report = f"{url}/user/report"
+        self._url_user_certificate = f"{url}/user/certificate"
+        self._url_user_certificates = f"{url}/user/certificates"
+        self._url_user_screening_search = f"{url}/user/screening/search"
+        self._url_user_screening_monitor = f"{url}/user/screening/monitor"
+        self._url_user_identify = f"{url}/user/identify"
+        self._url_user_authentication_enable = f"{url}/user/authentication/enable"
+        self._url_user_authentication_disable = f"{url}/user/authentication/disable"
+        self._url_user_authenticate = f"{url}/user/authenticate"
+        self._url_user_authentications_ids = f"{url}/user/authentications/ids"
+        self._url_user_authentications = f"{url}/user/authentications"
+        self._url_user_authentication = f"{url}/user/authentication"
+        self._url_media = f"{url}/media"
+        self._url_duplicates_search = f"{url}/duplicates/search"
+        self._url_duplicates_searches = f"{url}/duplicates/searches"
+        self._url_user_state = f"{url}/user/state"
+        self._url_flow = f"{url}/flow"
+        self._url_flows = f"{url}/flows"
+        self._url_user_flow = f"{url}/user/flow"
+
+    def _auth_headers(
+        self, token: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        # send_agent is read on every call so it can still be toggled on an existing client
+        agent_headers = self._agent_headers if self.send_agent else {}
+        if extra_headers:
+            return {
+                "Authorization": "Bearer " + token,
+                **agent_headers,
+                **extra_headers,
+            }
+        return {"Authorization": "Bearer " + token, **agent_headers}
 
     @timeit
     def healthcheck(self, verbose: Optional[bool] = False) -> Result[Response, Error]:
@@ -71,7 +140,7 @@ class OnboardingClient:
         print_intro("healthcheck", verbose=verbose)
 
         try:
-            response = self.session.get(f"{self.url}/healthcheck", timeout=self.timeout)
+            response = self.session.get(self._url_healthcheck, timeout=self.timeout)
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="healthcheck"))
         print_response(response=response, verbose=verbose)
@@ -117,19 +186,16 @@ class OnboardingClient:
 
         headers = self._auth_headers(backend_token)
 
-        data = None
-        if user_info:
-            data = data if data is not None else {}
-            data.update(user_info.dict())
-        if device_info:
-            data = data if data is not None else {}
-            data.update(device_info.dict())
-        if flow_id:
-            data = data if data is not None else {}
-            data.update({"flow_id": flow_id})
+        data: Optional[Dict[str, Any]] = None
+        if user_info or device_info or flow_id:
+            data = {
+                **(user_info.model_dump() if user_info else {}),
+                **(device_info.model_dump() if device_info else {}),
+                **({"flow_id": flow_id} if flow_id else {}),
+            }
         try:
             response = self.session.post(
-                f"{self.url}/user", headers=headers, data=data, timeout=self.timeout
+                self._url_user, headers=headers, data=data, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="create_user"))
@@ -137,6 +203,47 @@ class OnboardingClient:
 
         return Success(response)
 
+    def batch_create_users(
+        self,
+        user_infos: List[UserInfo],
+        device_infos: Optional[List[DeviceInfo]] = None,
+        flow_id: Union[str, None] = None,
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[Response, Error]]:
+        """
+        Creates several users concurrently, sharing the backend token and the session connection pool
+
+        Parameters
+        ----------
+        user_infos
+            List of objects with optional values with info about each User.
+        device_infos
+            Optional list of objects with info about each User's Device. It must have the same length as user_infos.
+        flow_id
+            Optional identifier of the onboarding flow
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+
+
+        Returns
+        -------
+            A list of Result objects with Response object [requests library], in the same order as user_infos
+        """
+        return map_users_concurrently(
+            lambda user_info, device_info: self.create_user(
+                user_info=user_info,
+                device_info=device_info,
+                flow_id=flow_id,
+                verbose=verbose,
+            ),
+            user_infos,
+            device_infos,
+            max_workers=max_workers,
+        )
+
     @early_return
     @timeit
     def delete_user(
@@ -167,7 +274,7 @@ class OnboardingClient:
 
         try:
             response = self.session.delete(
-                f"{self.url}/user", headers=headers, timeout=self.timeout
+                self._url_user, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="delete_user"))
@@ -205,7 +312,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/user/status", headers=headers, timeout=self.timeout
+                self._url_user_status, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="get_user_status"))
@@ -240,7 +347,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.get(
-                f"{self.url}/users/stats", headers=headers, timeout=self.timeout
+                self._url_users_stats, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="get_users_stats"))
@@ -273,7 +380,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.get(
-                f"{self.url}/users", headers=headers, timeout=self.timeout
+                self._url_users, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="get_users"))
@@ -328,19 +435,22 @@ class OnboardingClient:
         print_token("backend_token", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        url_query_params = f"?page={page}&page_size={page_size}&descending={descending}&authorized={authorized}"
-
+        params: Dict[str, Any] = {
+            "page": page,
+            "page_size": page_size,
+            "descending": descending,
+            "authorized": authorized,
+        }
         if filter_field and filter_value:
-            url_query_params = (
-                url_query_params
-                + f"&filter_field={filter_field}&filter_value={filter_value}"
-            )
+            params["filter_field"] = filter_field
+            params["filter_value"] = filter_value
         if sort_by:
-            url_query_params = url_query_params + f"&sort_by={sort_by}"
+            params["sort_by"] = sort_by
 
         try:
             response = self.session.get(
-                f"{self.url}/users/status{url_query_params}",
+                self._url_users_status,
+                params=params,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -401,7 +511,7 @@ class OnboardingClient:
 
         try:
             response = self.session.post(
-                self.url + "/user/feedback",
+                self._url_user_feedback,
                 data=data,
                 headers=headers,
                 timeout=self.timeout,
@@ -418,7 +528,7 @@ class OnboardingClient:
     def add_selfie(
         self,
         user_id: str,
-        media_data: bytes,
+        media_data: Union[bytes, BinaryIO],
         wait_for_completion: Optional[bool] = True,
         verbose: Optional[bool] = False,
     ) -> Result[Response, Error]:
@@ -432,7 +542,7 @@ class OnboardingClient:
         user_id
             User identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         wait_for_completion
             This setting specifies whether or not the request should return immediately or wait for the operation to complete before returning.
         verbose
@@ -448,15 +558,16 @@ class OnboardingClient:
         user_token = self.auth.create_user_token(user_id).unwrap_or_return()
         print_token("user_token", user_token, verbose=verbose)
 
-        headers = self._auth_headers(user_token)
-
-        files = {"video": ("video", media_data)}
+        encoder = multipart_encoder(
+            data={"wait_for_completion": wait_for_completion},
+            files={"video": ("video", media_data)},
+        )
+        headers = self._auth_headers(user_token, {"Content-Type": encoder.content_type})
 
         try:
             response = self.session.post(
-                f"{self.url}/user/selfie",
-                files=files,
-                data={"wait_for_completion": wait_for_completion},
+                self._url_user_selfie,
+                data=encoder,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -503,11 +614,11 @@ class OnboardingClient:
         try:
             if not selfie_id:
                 response = self.session.delete(
-                    f"{self.url}/user/selfie", headers=headers, timeout=self.timeout
+                    self._url_user_selfie, headers=headers, timeout=self.timeout
                 )
             else:
                 response = self.session.delete(
-                    f"{self.url}/user/selfie/{selfie_id}",
+                    f"{self._url_user_selfie}/{selfie_id}",
                     headers=headers,
                     timeout=self.timeout,
                 )
@@ -549,7 +660,7 @@ class OnboardingClient:
 
         try:
             response = self.session.patch(
-                f"{self.url}/user/selfie", headers=headers, timeout=self.timeout
+                self._url_user_selfie, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="void_selfie"))
@@ -591,7 +702,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/documents/supported", headers=headers, timeout=self.timeout
+                self._url_documents_supported, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="supported_documents"))
@@ -638,7 +749,7 @@ class OnboardingClient:
         data = {"type": type.value, "issuing_country": issuing_country}
         try:
             response = self.session.post(
-                f"{self.url}/user/document",
+                self._url_user_document,
                 data=data,
                 headers=headers,
                 timeout=self.timeout,
@@ -681,7 +792,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.delete(
-                f"{self.url}/user/document/{document_id}",
+                f"{self._url_user_document}/{document_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -722,7 +833,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.patch(
-                f"{self.url}/user/document/{document_id}",
+                f"{self._url_user_document}/{document_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -739,7 +850,7 @@ class OnboardingClient:
         self,
         user_id: str,
         document_id: str,
-        media_data: bytes,
+        media_data: Union[bytes, BinaryIO],
         side: DocumentSide,
         manual: bool = False,
         source: DocumentSource = DocumentSource.file,
@@ -759,7 +870,7 @@ class OnboardingClient:
         document_id
             Document identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         side
             Side of the document [front or back]
         manual
@@ -783,7 +894,6 @@ class OnboardingClient:
         user_token = self.auth.create_user_token(user_id).unwrap_or_return()
         print_token("user_token", user_token, verbose=verbose)
 
-        headers = self._auth_headers(user_token)
         data = {
             "document_id": document_id,
             "side": side.value,
@@ -793,15 +903,15 @@ class OnboardingClient:
         }
 
         if bounding_box:
-            data["bounding_box"] = bounding_box.json()
+            data["bounding_box"] = bounding_box.model_dump_json()
 
-        files = {"image": ("image", media_data)}
+        encoder = multipart_encoder(data=data, files={"image": ("image", media_data)})
+        headers = self._auth_headers(user_token, {"Content-Type": encoder.content_type})
 
         try:
             response = self.session.put(
-                f"{self.url}/user/document",
-                files=files,
-                data=data,
+                self._url_user_document,
+                data=encoder,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -852,7 +962,7 @@ class OnboardingClient:
 
         try:
             response = self.session.post(
-                f"{self.url}/user/document/properties",
+                self._url_user_document_properties,
                 data=data,
                 headers=headers,
                 timeout=self.timeout,
@@ -894,7 +1004,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.delete(
-                f"{self.url}/user/other-trusted-document/{document_id}",
+                f"{self._url_user_other_trusted_document}/{document_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -938,7 +1048,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_token)
         try:
             response = self.session.patch(
-                f"{self.url}/user/other-trusted-document/{document_id}",
+                f"{self._url_user_other_trusted_document}/{document_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -955,7 +1065,7 @@ class OnboardingClient:
     def add_other_trusted_document(
         self,
         user_id: str,
-        media_data: bytes,
+        media_data: Union[bytes, BinaryIO],
         category: Optional[str] = None,
         verbose: Optional[bool] = False,
     ) -> Result[Response, Error]:
@@ -970,7 +1080,7 @@ class OnboardingClient:
         user_id
             User identifier
         media_data
-            Binary media data (pdf).
+            Binary media data of pdf file (bytes or a binary file object, which is streamed).
         category
             Optional value to identify an Other Trusted Document (e.g invoice)
         verbose
@@ -986,16 +1096,14 @@ class OnboardingClient:
         user_token = self.auth.create_user_token(user_id).unwrap_or_return()
         print_token("user_token", user_token, verbose=verbose)
 
-        headers = self._auth_headers(user_token)
-        files = {"pdf": ("pdf", media_data)}
-
         data = dict(category=category) if category else dict()
+        encoder = multipart_encoder(data=data, files={"pdf": ("pdf", media_data)})
+        headers = self._auth_headers(user_token, {"Content-Type": encoder.content_type})
 
         try:
             response = self.session.post(
-                f"{self.url}/user/other-trusted-document",
-                files=files,
-                data=data,
+                self._url_user_other_trusted_document,
+                data=encoder,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1042,12 +1150,13 @@ class OnboardingClient:
         ).unwrap_or_return()
         print_token("backend_token_with_user", backend_user_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_user_token)
-        headers["Alice-Report-Version"] = version.value
+        headers = self._auth_headers(
+            backend_user_token, {"Alice-Report-Version": version.value}
+        )
 
         try:
             response = self.session.get(
-                f"{self.url}/user/report", headers=headers, timeout=self.timeout
+                self._url_user_report, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="create_report"))
@@ -1096,11 +1205,10 @@ class OnboardingClient:
 
         options = {"template_name": template_name, "locale": locale.value}
         headers = self._auth_headers(backend_user_token)
-        headers["Content-Type"] = "application/json"
         try:
             response = self.session.post(
-                f"{self.url}/user/certificate",
-                data=json.dumps(options),
+                self._url_user_certificate,
+                json=options,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1145,7 +1253,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.get(
-                f"{self.url}/user/certificate/{certificate_id}",
+                f"{self._url_user_certificate}/{certificate_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1185,7 +1293,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.get(
-                f"{self.url}/user/certificates", headers=headers, timeout=self.timeout
+                self._url_user_certificates, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="retrieve_certificates"))
@@ -1224,7 +1332,7 @@ class OnboardingClient:
         print_token("backend_token_with_user", backend_user_token, verbose=verbose)
         headers = self._auth_headers(backend_user_token)
 
-        url = f"{self.url}/user/screening/search"
+        url = self._url_user_screening_search
         if detail:
             url += "/detail"
 
@@ -1271,7 +1379,7 @@ class OnboardingClient:
 
         try:
             response = self.session.post(
-                f"{self.url}/user/screening/monitor",
+                self._url_user_screening_monitor,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1313,7 +1421,7 @@ class OnboardingClient:
 
         try:
             response = self.session.delete(
-                f"{self.url}/user/screening/monitor",
+                self._url_user_screening_monitor,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1356,7 +1464,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/user/screening/monitor",
+                self._url_user_screening_monitor,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1401,14 +1509,15 @@ class OnboardingClient:
         ).unwrap_or_return()
         print_token("backend_token_with_user", backend_user_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_user_token)
-        headers["Alice-Identify-Version"] = version.value
+        headers = self._auth_headers(
+            backend_user_token, {"Alice-Identify-Version": version.value}
+        )
 
         data = {"user_ids": probe_user_ids}
 
         try:
             response = self.session.post(
-                f"{self.url}/user/identify",
+                self._url_user_identify,
                 headers=headers,
                 data=data,
                 timeout=self.timeout,
@@ -1449,7 +1558,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.post(
-                f"{self.url}/user/authentication/enable",
+                self._url_user_authentication_enable,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1489,7 +1598,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.post(
-                f"{self.url}/user/authentication/disable",
+                self._url_user_authentication_disable,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1502,7 +1611,7 @@ class OnboardingClient:
     @early_return
     @timeit
     def authenticate_user(
-        self, user_id: str, media_data: bytes, verbose: bool = False
+        self, user_id: str, media_data: Union[bytes, BinaryIO], verbose: bool = False
     ) -> Result[Response, Error]:
         """
 
@@ -1513,7 +1622,7 @@ class OnboardingClient:
         user_id
             User identifier
         media_data
-            Binary media data.
+            Binary media data (bytes or a binary file object, which is streamed).
         verbose
             Used for print service response as well as the time elapsed
 
@@ -1527,14 +1636,13 @@ class OnboardingClient:
         user_token = self.auth.create_user_token(user_id=user_id).unwrap_or_return()
         print_token("user_token", user_token, verbose=verbose)
 
-        headers = self._auth_headers(user_token)
-
-        files = {"video": ("video", media_data)}
+        encoder = multipart_encoder(data={}, files={"video": ("video", media_data)})
+        headers = self._auth_headers(user_token, {"Content-Type": encoder.content_type})
 
         try:
             response = self.session.post(
-                f"{self.url}/user/authenticate",
-                files=files,
+                self._url_user_authenticate,
+                data=encoder,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1576,7 +1684,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/user/authentications/ids",
+                self._url_user_authentications_ids,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1628,16 +1736,16 @@ class OnboardingClient:
         ).unwrap_or_return()
         print_token("backend_token_with_user", backend_user_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_user_token)
-        headers["Alice-Authentication-Version"] = version.value
-
-        url_query_params = (
-            f"?page={str(page)}&page_size={str(page_size)}&descending={str(descending)}"
+        headers = self._auth_headers(
+            backend_user_token, {"Alice-Authentication-Version": version.value}
         )
 
+        params = {"page": page, "page_size": page_size, "descending": descending}
+
         try:
             response = self.session.get(
-                f"{self.url}/user/authentications" + url_query_params,
+                self._url_user_authentications,
+                params=params,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1683,12 +1791,13 @@ class OnboardingClient:
         ).unwrap_or_return()
         print_token("backend_token_with_user", backend_user_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_user_token)
-        headers["Alice-Authentication-Version"] = version.value
+        headers = self._auth_headers(
+            backend_user_token, {"Alice-Authentication-Version": version.value}
+        )
 
         try:
             response = self.session.get(
-                f"{self.url}/user/authentication/{authentication_id}",
+                f"{self._url_user_authentication}/{authentication_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1701,7 +1810,7 @@ class OnboardingClient:
     @early_return
     @timeit
     def retrieve_media(
-        self, user_id: str, media_id: str, verbose: bool = False
+        self, user_id: str, media_id: str, verbose: bool = False, stream: bool = False
     ) -> Result[Response, Error]:
         """
 
@@ -1715,6 +1824,8 @@ class OnboardingClient:
             Identifier obtained, for example from the report
         verbose
             Used for print service response as well as the time elapsed
+        stream
+            If True, the body is not downloaded until it is read (e.g. with response.iter_content)
 
 
         Returns
@@ -1732,20 +1843,21 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/media/{media_id}/download",
+                f"{self._url_media}/{media_id}/download",
                 headers=headers,
                 timeout=self.timeout,
+                stream=stream,
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="retrieve_media"))
-        print_response(response=response, verbose=verbose)
+        print_response(response=response, verbose=verbose, stream=stream)
 
         return Success(response)
 
     @early_return
     @timeit
     def download(
-        self, user_id: str, href: str, verbose: bool = False
+        self, user_id: str, href: str, verbose: bool = False, stream: bool = False
     ) -> Result[Response, Error]:
         """
 
@@ -1759,6 +1871,8 @@ class OnboardingClient:
             href obtained, for example from the report
         verbose
             Used for print service response as well as the time elapsed
+        stream
+            If True, the body is not downloaded until it is read (e.g. with response.iter_content)
 
 
         Returns
@@ -1775,10 +1889,12 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
 
         try:
-            response = self.session.get(href, headers=headers, timeout=self.timeout)
+            response = self.session.get(
+                href, headers=headers, timeout=self.timeout, stream=stream
+            )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="download"))
-        print_response(response=response, verbose=verbose)
+        print_response(response=response, verbose=verbose, stream=stream)
 
         return Success(response)
 
@@ -1821,7 +1937,7 @@ class OnboardingClient:
         }
         try:
             response = self.session.post(
-                f"{self.url}/duplicates/search",
+                self._url_duplicates_search,
                 data=data,
                 headers=headers,
                 timeout=self.timeout,
@@ -1865,7 +1981,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/duplicates/search/{search_id}",
+                f"{self._url_duplicates_search}/{search_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1902,7 +2018,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/duplicates/searches", headers=headers, timeout=self.timeout
+                self._url_duplicates_searches, headers=headers, timeout=self.timeout
             )
         except requests.exceptions.Timeout:
             return Failure(OnboardingError.timeout(operation="get_duplicates_searches"))
@@ -1910,6 +2026,7 @@ class OnboardingClient:
 
         return Success(response)
 
+    @early_return
     @timeit
     def get_user_state(
         self,
@@ -1941,7 +2058,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.get(
-                f"{self.url}/user/state",
+                self._url_user_state,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1952,6 +2069,35 @@ class OnboardingClient:
 
         return Success(response)
 
+    def batch_get_user_states(
+        self,
+        user_ids: List[str],
+        max_workers: int = 10,
+        verbose: bool = False,
+    ) -> List[Result[Response, Error]]:
+        """
+        Retrieves the state of several users concurrently, sharing the session connection pool
+
+        Parameters
+        ----------
+        user_ids
+            List of user identifiers
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+
+
+        Returns
+        -------
+            A list of Result objects with Response object [requests library], in the same order as user_ids
+        """
+        return map_concurrently(
+            lambda user_id: self.get_user_state(user_id=user_id, verbose=verbose),
+            user_ids,
+            max_workers=max_workers,
+        )
+
     @timeit
     def update_user_state(
         self,
@@ -1992,7 +2138,7 @@ class OnboardingClient:
         headers = self._auth_headers(backend_user_token)
         try:
             response = self.session.patch(
-                f"{self.url}/user/state",
+                self._url_user_state,
                 headers=headers,
                 json={
                     "state": user_state.value,
@@ -2034,13 +2180,12 @@ class OnboardingClient:
 
         headers = self._auth_headers(backend_token)
 
-        url = f"{self.url}/flow"
-        if flow_id:
-            url = f"{self.url}/flow?flow_id={flow_id}"
+        params = {"flow_id": flow_id} if flow_id else None
 
         try:
             response = self.session.get(
-                url,
+                self._url_flow,
+                params=params,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -2074,7 +2219,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/flows",
+                self._url_flows,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -2132,7 +2277,7 @@ class OnboardingClient:
 
         try:
             response = self.session.post(
-                f"{self.url}/flow",
+                self._url_flow,
                 headers=headers,
                 json=data,
                 timeout=self.timeout,
@@ -2189,7 +2334,7 @@ class OnboardingClient:
 
         try:
             response = self.session.patch(
-                f"{self.url}/flow",
+                self._url_flow,
                 headers=headers,
                 json=data,
                 timeout=self.timeout,
@@ -2230,7 +2375,8 @@ class OnboardingClient:
 
         try:
             response = self.session.delete(
-                f"{self.url}/flow?flow_id={flow_id}",
+                self._url_flow,
+                params={"flow_id": flow_id},
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -2270,7 +2416,7 @@ class OnboardingClient:
 
         try:
             response = self.session.get(
-                f"{self.url}/user/flow",
+                self._url_user_flow,
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -2313,7 +2459,7 @@ class OnboardingClient:
 
         try:
             response = self.session.patch(
-                f"{self.url}/user/flow/{flow_id}",
+                f"{self._url_user_flow}/{flow_id}",
                 headers=headers,
                 timeout=self.timeout,
             )
@@ -1,7 +1,7 @@
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from meiga import Error
-from pydantic.dataclasses import dataclass
 from requests import Response
 
 
@@ -11,13 +11,6 @@ class OnboardingError(Error):
     code: int
     message: Optional[Dict[str, Any]] = None  # type: ignore
 
-    def __init__(
-        self, operation: str, code: int, message: Optional[Dict[str, Any]] = None
-    ):
-        self.operation = operation
-        self.code = code
-        self.message = message
-
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -27,6 +20,10 @@ class OnboardingError(Error):
     @staticmethod
     def from_response(operation: str, response: Response) -> "OnboardingError":
         code = response.status_code
+        if not response.content:
+            return OnboardingError(
+                operation=operation, code=code, message={"message": "no content"}
+            )
         try:
             message = response.json()
             # old {'error': {'message': 'Method Not Allowed: to unlock it please open a ticket with the support team', 'type': 'EntryPointNotAvailableHttpError'}}
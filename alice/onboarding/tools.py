@@ -1,44 +1,161 @@
+import io
+import os
 import time
-from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from requests import Response
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
+from urllib3.util.retry import Retry
+
+from alice.config import DEFAULT_MAX_RETRIES, DEFAULT_POOL_MAXSIZE
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+QUIET = os.environ.get("ALICE_ONBOARDING_QUIET") == "1"
+LOG_TRUNCATE_BYTES = 4096
 
 
 def timeit(func: Callable[..., Any]) -> Callable[..., Any]:
+    if QUIET:
+        return func
+
+    @wraps(func)
     def timed(*args: Any, **kwargs: Any) -> Any:
-        ts = time.time()
+        if not kwargs.get("verbose"):
+            return func(*args, **kwargs)
+        ts = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        te = time.time()
-        if "verbose" in kwargs and kwargs["verbose"]:
-            print(f"elapsed time: {te - ts:.2f} s")
-            print("=================================\n")
+        te = time.perf_counter_ns()
+        print(f"elapsed time: {(te - ts) / 1e9:.2f} s")
+        print("=================================\n")
         return result
 
     return timed
 
 
-def print_intro(method_name: str, verbose: Optional[bool] = False) -> None:
-    if verbose:
-        print("=================================")
-        print(f"method: {method_name}")
+def create_session(
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE, max_retries: int = DEFAULT_MAX_RETRIES
+) -> Session:
+    """
+    Returns a requests Session whose connection pool keeps up to pool_maxsize connections alive per host.
+    Requests without body (GET, HEAD, OPTIONS, DELETE) are retried up to max_retries times with exponential backoff
+    on 429, 502, 503 and 504 responses, honouring the Retry-After header. Uploads are never retried as streamed
+    multipart bodies cannot be replayed.
+    Read errors are not retried so that timeouts are still raised as requests.exceptions.Timeout.
+    """
+    retry = Retry(
+        total=max_retries,
+        read=False,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "DELETE"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    session = Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def multipart_encoder(
+    data: Dict[str, Any],
+    files: Dict[str, Tuple[str, Union[bytes, IO[bytes]]]],
+) -> MultipartEncoder:
+    """
+    Returns a MultipartEncoder equivalent to requests' files/data encoding which streams the given media
+    to the socket instead of building the whole multipart body in memory.
+    Fields with None values are skipped and bytes payloads are read through a BytesIO view.
+    """
+    fields: List[Tuple[str, Any]] = [
+        (name, str(value)) for name, value in data.items() if value is not None
+    ]
+    for name, (filename, media) in files.items():
+        if isinstance(media, bytes):
+            media = io.BytesIO(media)
+        fields.append((name, (filename, media)))
+    return MultipartEncoder(fields=fields)
+
+
+if QUIET:
+    # Production knob: verbose output is disabled, so the print helpers do nothing
 
+    def print_intro(method_name: str, verbose: Optional[bool] = False) -> None:
+        return None
 
-def print_response(response: Response, verbose: Optional[bool] = False) -> None:
-    if verbose:
-        headers = response.headers
-        content_type = headers["Content-Type"]
-        if "image" in content_type or "video" in content_type:
-            print(f"response {response.status_code} -> {content_type}")
-        else:
-            text = response.text
-            if text[-1:] == "\n":
-                text = text[:-1]
+    def print_response(
+        response: Response, verbose: Optional[bool] = False, stream: bool = False
+    ) -> None:
+        return None
+
+    def print_token(
+        type_token: str, token: str, verbose: Optional[bool] = False
+    ) -> None:
+        return None
+
+else:
+
+    def print_intro(method_name: str, verbose: Optional[bool] = False) -> None:
+        if verbose:
+            print("=================================")
+            print(f"method: {method_name}")
+
+    def print_response(
+        response: Response, verbose: Optional[bool] = False, stream: bool = False
+    ) -> None:
+        if verbose:
+            content_type = response.headers.get("Content-Type", "")
+            if stream or "image" in content_type or "video" in content_type:
+                # Streamed bodies are left unread for the caller
+                print(f"response {response.status_code} -> {content_type}")
+                return
+
+            content = response.content
+            if len(content) > LOG_TRUNCATE_BYTES:
+                print(
+                    f"response {response.status_code} -> {content_type} \n"
+                    f"{len(content)} bytes, truncated: {content[:LOG_TRUNCATE_BYTES]!r}"
+                )
+                return
+
+            text = content.decode(response.encoding or "utf-8", errors="replace")
+            text = text.rstrip("\n")
             if text == "":
                 print(f"response {response.status_code} -> {content_type}")
             else:
                 print(f"response {response.status_code} -> {content_type} \n{text}")
 
+    def print_token(
+        type_token: str, token: str, verbose: Optional[bool] = False
+    ) -> None:
+        if verbose:
+            print(f"{type_token}: {token}")
+
 
-def print_token(type_token: str, token: str, verbose: Optional[bool] = False) -> None:
-    if verbose:
-        print(f"{type_token}: {token}")
+def map_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = 10
+) -> List[R]:
+    """
+    Applies func to every item using a pool of threads and returns the results in the same order as items.
+    Keep max_workers lower or equal than the connection pool size of the shared session.
+    The session may be shared by the threads as long as its configuration (headers, cookies, adapters) is not
+    modified while they run.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
@@ -1,45 +1,84 @@
 # Copyright (C) 2019+ Alice, Vigo, Spain
 
-"""Public API of Alice Onboarding Python SDK"""
-from typing import List
+"""Public API of Alice Onboarding Python SDK
 
-from alice.face.face import Face
-from alice.face.face_models import DocumentResult, FaceError, SelfieResult
-from alice.onboarding.enums.environment import Environment
+Names are imported on first access (PEP 562) so that using a single subsystem
+(e.g. ``Onboarding``) does not pay the import cost of the others.
+"""
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# Modules
-from alice.webhooks.webhook import Webhook
-from alice.webhooks.webhooks import Webhooks
-from alice.webhooks.webhooks_client import WebhooksClient
+if TYPE_CHECKING:
+    from alice.auth.auth import Auth
+    from alice.auth.auth_client import AuthClient
+    from alice.config import Config
+    from alice.face.face import Face
+    from alice.face.face_models import DocumentResult, FaceError, SelfieResult
+    from alice.onboarding.enums.decision import Decision
+    from alice.onboarding.enums.document_side import DocumentSide
+    from alice.onboarding.enums.document_source import DocumentSource
+    from alice.onboarding.enums.document_type import DocumentType
+    from alice.onboarding.enums.environment import Environment
+    from alice.onboarding.enums.version import Version
+    from alice.onboarding.models.bounding_box import BoundingBox
+    from alice.onboarding.models.device_info import DeviceInfo
+    from alice.onboarding.models.report.document.document_report import DocumentReport
+    from alice.onboarding.models.report.other_trusted_document.other_trusted_document_report import (
+        OtherTrustedDocumentReport,
+    )
+    from alice.onboarding.models.report.report import Report
+    from alice.onboarding.models.report.selfie.selfie_report import SelfieReport
+    from alice.onboarding.models.report.summary.report_summary import ReportSummary
+    from alice.onboarding.models.user_info import UserInfo
+    from alice.onboarding.onboarding import Onboarding
+    from alice.onboarding.onboarding_client import OnboardingClient
+    from alice.onboarding.onboarding_errors import OnboardingError
+    from alice.sandbox.sandbox import Sandbox
+    from alice.sandbox.sandbox_client import SandboxClient
+    from alice.sandbox.sandbox_errors import SandboxError
+    from alice.webhooks.webhook import Webhook
+    from alice.webhooks.webhooks import Webhooks
+    from alice.webhooks.webhooks_client import WebhooksClient
 
-modules: List[str] = []
-
-from alice.auth.auth import Auth
-from alice.auth.auth_client import AuthClient
-from alice.config import Config
-from alice.onboarding.enums.decision import Decision
-from alice.onboarding.enums.document_side import DocumentSide
-from alice.onboarding.enums.document_source import DocumentSource
-from alice.onboarding.enums.document_type import DocumentType
-from alice.onboarding.enums.version import Version
-from alice.onboarding.models.bounding_box import BoundingBox
-from alice.onboarding.models.device_info import DeviceInfo
-from alice.onboarding.models.report.document.document_report import DocumentReport
-from alice.onboarding.models.report.other_trusted_document.other_trusted_document_report import (
-    OtherTrustedDocumentReport,
-)
-
-# Report
-from alice.onboarding.models.report.report import Report
-from alice.onboarding.models.report.selfie.selfie_report import SelfieReport
-from alice.onboarding.models.report.summary.report_summary import ReportSummary
-from alice.onboarding.models.user_info import UserInfo
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Modules
+    "Webhook": "alice.webhooks.webhook",
+    "Webhooks": "alice.webhooks.webhooks",
+    "WebhooksClient": "alice.webhooks.webhooks_client",
+    # Classes
+    "Onboarding": "alice.onboarding.onboarding",
+    "OnboardingClient": "alice.onboarding.onboarding_client",
+    "UserInfo": "alice.onboarding.models.user_info",
+    "DeviceInfo": "alice.onboarding.models.device_info",
+    "Auth": "alice.auth.auth",
+    "AuthClient": "alice.auth.auth_client",
+    "Sandbox": "alice.sandbox.sandbox",
+    "SandboxClient": "alice.sandbox.sandbox_client",
+    "Config": "alice.config",
+    "Decision": "alice.onboarding.enums.decision",
+    "DocumentType": "alice.onboarding.enums.document_type",
+    "Version": "alice.onboarding.enums.version",
+    "DocumentSide": "alice.onboarding.enums.document_side",
+    "DocumentSource": "alice.onboarding.enums.document_source",
+    "BoundingBox": "alice.onboarding.models.bounding_box",
+    "Environment": "alice.onboarding.enums.environment",
+    # Report
+    "Report": "alice.onboarding.models.report.report",
+    "ReportSummary": "alice.onboarding.models.report.summary.report_summary",
+    "DocumentReport": "alice.onboarding.models.report.document.document_report",
+    "SelfieReport": "alice.onboarding.models.report.selfie.selfie_report",
+    "OtherTrustedDocumentReport": "alice.onboarding.models.report.other_trusted_document.other_trusted_document_report",
+    # Face
+    "Face": "alice.face.face",
+    "SelfieResult": "alice.face.face_models",
+    "DocumentResult": "alice.face.face_models",
+    "FaceError": "alice.face.face_models",
+    # Errors
+    "OnboardingError": "alice.onboarding.onboarding_errors",
+    "SandboxError": "alice.sandbox.sandbox_errors",
+}
 
-# Classes
-from alice.onboarding.onboarding import Onboarding
-from alice.onboarding.onboarding_client import OnboardingClient
-from alice.sandbox.sandbox import Sandbox
-from alice.sandbox.sandbox_client import SandboxClient
+modules: List[str] = []
 
 classes = [
     "Onboarding",
@@ -69,11 +108,20 @@ classes = [
 ]
 face = ["Face", "SelfieResult", "DocumentResult", "FaceError", "BoundingBox"]
 
-
-# Errors
-from alice.onboarding.onboarding_errors import OnboardingError
-from alice.sandbox.sandbox_errors import SandboxError
-
 errors = ["OnboardingError", "SandboxError"]
 
 __all__ = modules + classes + errors + face
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
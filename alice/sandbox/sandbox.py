@@ -1,12 +1,14 @@
-import time
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-import jwt
 from meiga import Failure, Result, Success, isSuccess
+from requests import Session
 
+from alice.auth.token_tools import is_valid_token
 from alice.config import Config
+from alice.onboarding.batch import map_users_concurrently
 from alice.onboarding.models.device_info import DeviceInfo
 from alice.onboarding.models.user_info import UserInfo
+from alice.onboarding.tools import create_session, map_concurrently
 from alice.sandbox.sandbox_client import SandboxClient
 from alice.sandbox.sandbox_errors import SandboxError
 
@@ -16,10 +18,17 @@ DEFAULT_URL = "https://apis.alicebiometrics.com/onboarding/sandbox"
 class Sandbox:
     @staticmethod
     def from_config(config: Config) -> "Sandbox":
+        if config.session:
+            session = config.session
+        else:
+            session = create_session(
+                pool_maxsize=config.pool_maxsize, max_retries=config.max_retries
+            )
         return Sandbox(
             sandbox_token=config.sandbox_token,  # type: ignore
             url=config.sandbox_url,  # type: ignore
             verbose=config.verbose,
+            session=session,
         )
 
     def __init__(
@@ -27,18 +36,17 @@ class Sandbox:
         sandbox_token: str,
         url: str = DEFAULT_URL,
         verbose: Optional[bool] = False,
+        session: Union[Session, None] = None,
     ) -> None:
-        self.sandbox_client = SandboxClient(sandbox_token=sandbox_token, url=url)
+        self.sandbox_client = SandboxClient(
+            sandbox_token=sandbox_token, url=url, session=session
+        )
         self.url = url
         self.verbose = verbose
 
     @staticmethod
     def _is_token_valid(token: Union[str, None], margin_seconds: int = 60) -> bool:
-        if not token:
-            return False
-
-        decoded_token = jwt.decode(token, verify=False)
-        return bool(decoded_token["exp"] > time.time() - margin_seconds)
+        return is_valid_token(token, margin_seconds)
 
     def healthcheck(
         self, verbose: Optional[bool] = False
@@ -138,6 +146,66 @@ class Sandbox:
                 SandboxError.from_response(operation="delete_user", response=response)
             )
 
+    def batch_create_users(
+        self,
+        user_infos: List[UserInfo],
+        device_infos: Optional[List[DeviceInfo]] = None,
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[str, SandboxError]]:
+        """
+        Creates several Sandbox users concurrently
+        Parameters
+        ----------
+        user_infos
+            List of objects with optional values with info about each User.
+        device_infos
+            Optional list of objects with info about each User's Device. It must have the same length as user_infos.
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as user_infos, where if the operation is successful it returns a user_id.
+            Otherwise, it returns an SandboxError.
+        """
+        return map_users_concurrently(
+            lambda user_info, device_info: self.create_user(
+                user_info=user_info, device_info=device_info, verbose=verbose
+            ),
+            user_infos,
+            device_infos,
+            max_workers=max_workers,
+        )
+
+    def batch_delete_users(
+        self,
+        emails: List[str],
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[bool, SandboxError]]:
+        """
+        Deletes several Sandbox users concurrently
+        Parameters
+        ----------
+        emails
+            List of User's emails
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as emails, where if the operation is successful it returns True.
+            Otherwise, it returns an SandboxError.
+        """
+        return map_concurrently(
+            lambda email: self.delete_user(email=email, verbose=verbose),
+            emails,
+            max_workers=max_workers,
+        )
+
     def get_user(
         self, email: str, verbose: Optional[bool] = False
     ) -> Result[Dict[str, Any], SandboxError]:
@@ -1,22 +1,29 @@
 from typing import Any, Dict, Optional, Union
 
-from requests import Response, request
+from requests import Response, Session
 
 from alice.onboarding.models.device_info import DeviceInfo
 from alice.onboarding.models.user_info import UserInfo
-from alice.onboarding.tools import print_intro, print_response, timeit
+from alice.onboarding.tools import create_session, print_intro, print_response, timeit
 
 DEFAULT_URL = "https://apis.alicebiometrics.com/onboarding/sandbox"
 
 
 class SandboxClient:
-    def __init__(self, sandbox_token: str, url: str = DEFAULT_URL):
+    def __init__(
+        self,
+        sandbox_token: str,
+        url: str = DEFAULT_URL,
+        session: Union[Session, None] = None,
+    ):
         self.sandbox_token = sandbox_token
         self.url = url
-
-    def _auth_headers(self, token: str) -> Dict[str, Any]:
-        auth_headers = {"Authorization": f"Bearer {token}"}
-        return auth_headers
+        self.session = session if session is not None else create_session()
+        base_url = url.rstrip("/")
+        self._url_healthcheck = f"{base_url}/healthcheck"
+        self._url_user = f"{base_url}/user"
+        self._url_user_token = f"{base_url}/user/token"
+        self._auth_header = {"Authorization": f"Bearer {sandbox_token}"}
 
     @timeit
     def healthcheck(self, verbose: Optional[bool] = False) -> Response:
@@ -36,7 +43,7 @@ class SandboxClient:
         """
         print_intro("healthcheck", verbose=verbose)
 
-        response = request("GET", self.url + "/healthcheck")
+        response = self.session.get(self._url_healthcheck)
 
         print_response(response=response, verbose=verbose)
 
@@ -69,17 +76,16 @@ class SandboxClient:
         """
         print_intro("create_user", verbose=verbose)
 
-        headers = self._auth_headers(self.sandbox_token)
+        headers = self._auth_header
 
-        data = None
-        if user_info:
-            data = data if data is not None else {}
-            data.update(user_info.dict())
-        if device_info:
-            data = data if data is not None else {}
-            data.update(device_info.dict())
+        data: Optional[Dict[str, Any]] = None
+        if user_info or device_info:
+            data = {
+                **(user_info.model_dump() if user_info else {}),
+                **(device_info.model_dump() if device_info else {}),
+            }
 
-        response = request("POST", self.url + "/user", headers=headers, data=data)
+        response = self.session.post(self._url_user, headers=headers, data=data)
 
         print_response(response=response, verbose=verbose)
 
@@ -105,8 +111,8 @@ class SandboxClient:
         """
         print_intro("delete_user", verbose=verbose)
 
-        headers = self._auth_headers(self.sandbox_token)
-        response = request("DELETE", self.url + f"/user/{email}", headers=headers)
+        headers = self._auth_header
+        response = self.session.delete(f"{self._url_user}/{email}", headers=headers)
 
         print_response(response=response, verbose=verbose)
 
@@ -132,9 +138,9 @@ class SandboxClient:
         """
         print_intro("get_user", verbose=verbose)
 
-        headers = self._auth_headers(self.sandbox_token)
+        headers = self._auth_header
 
-        response = request("GET", self.url + f"/user/{email}", headers=headers)
+        response = self.session.get(f"{self._url_user}/{email}", headers=headers)
 
         print_response(response=response, verbose=verbose)
 
@@ -160,9 +166,9 @@ class SandboxClient:
         """
         print_intro("get_user_token", verbose=verbose)
 
-        headers = self._auth_headers(self.sandbox_token)
+        headers = self._auth_header
 
-        response = request("GET", self.url + f"/user/token/{email}", headers=headers)
+        response = self.session.get(f"{self._url_user_token}/{email}", headers=headers)
 
         print_response(response=response, verbose=verbose)
 
@@ -1,8 +1,19 @@
 import json
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 class Webhook:
+    __slots__ = (
+        "webhook_id",
+        "active",
+        "post_url",
+        "api_key",
+        "secret",
+        "algorithm",
+        "event_name",
+        "event_version",
+    )
+
     @staticmethod
     def from_dict(kdict: Dict[str, Any]) -> "Webhook":
         return Webhook(
@@ -54,13 +65,28 @@ class Webhook:
         self.event_version = event_version
         super().__init__()
 
+    def _key(self) -> Tuple[Any, ...]:
+        # Same fields as to_dict (falsy webhook_id/algorithm are omitted there)
+        return (
+            self.active,
+            self.post_url,
+            self.api_key,
+            self.secret,
+            self.event_name,
+            self.event_version,
+            self.webhook_id or None,
+            self.algorithm or None,
+        )
+
     def __repr__(self) -> str:
         return json.dumps(self.to_dict())
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if issubclass(other.__class__, self.__class__) or issubclass(
             self.__class__, other.__class__
         ):
-            return bool(self.to_dict() == other.to_dict())
+            return bool(self._key() == other._key())
         else:
             return False
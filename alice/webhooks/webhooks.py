@@ -7,6 +7,7 @@ from alice.auth.auth import Auth
 from alice.auth.auth_errors import AuthError
 from alice.config import Config
 from alice.onboarding.onboarding_errors import OnboardingError
+from alice.onboarding.tools import create_session, map_concurrently
 from alice.webhooks.webhook import Webhook
 from alice.webhooks.webhooks_client import WebhooksClient
 
@@ -19,10 +20,13 @@ class Webhooks:
         if config.session:
             session = config.session
         else:
-            session = Session()
+            session = create_session(
+                pool_maxsize=config.pool_maxsize, max_retries=config.max_retries
+            )
         return Webhooks(
-            auth=Auth.from_config(config),
+            auth=Auth.from_config(config, session=session),
             url=config.onboarding_url,  # type: ignore
+            timeout=config.timeout,
             send_agent=config.send_agent,
             verbose=config.verbose,
             session=session,
@@ -35,9 +39,10 @@ class Webhooks:
         url: str = DEFAULT_URL,
         send_agent: bool = True,
         verbose: Optional[bool] = False,
+        timeout: Union[float, None] = None,
     ):
         self.webhooks_client = WebhooksClient(
-            auth=auth, url=url, send_agent=send_agent, session=session
+            auth=auth, url=url, timeout=timeout, send_agent=send_agent, session=session
         )
         self.url = url
         self.verbose = verbose
@@ -181,6 +186,39 @@ class Webhooks:
                 )
             )
 
+    def batch_update_webhooks_activation(
+        self,
+        activations: Dict[str, bool],
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> Dict[str, Result[Dict[str, Any], Union[OnboardingError, AuthError]]]:
+        """
+        Updates the activation of several Webhooks concurrently
+        Parameters
+        ----------
+        activations
+            Dictionary with the activation boolean value to set for each Webhook identifier
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A dictionary with a Result for each Webhook identifier where if the operation is successful it returns
+            True. Otherwise, it returns an OnboardingError or AuthError.
+        """
+        webhook_ids = list(activations)
+        results = map_concurrently(
+            lambda webhook_id: self.update_webhook_activation(
+                webhook_id=webhook_id,
+                active=activations[webhook_id],
+                verbose=verbose,
+            ),
+            webhook_ids,
+            max_workers=max_workers,
+        )
+        return dict(zip(webhook_ids, results))
+
     @early_return
     def ping_webhook(
         self, webhook_id: str, verbose: Optional[bool] = False
@@ -214,6 +252,35 @@ class Webhooks:
                 )
             )
 
+    def batch_ping_webhooks(
+        self,
+        webhook_ids: List[str],
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[bool, Union[OnboardingError, AuthError]]]:
+        """
+        Sends ping event to several configured and active Webhooks concurrently
+        Parameters
+        ----------
+        webhook_ids
+            List of Webhook identifiers
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as webhook_ids, where if the operation is successful it returns True.
+            Otherwise, it returns an OnboardingError or AuthError.
+        """
+        return map_concurrently(
+            lambda webhook_id: self.ping_webhook(
+                webhook_id=webhook_id, verbose=verbose
+            ),
+            webhook_ids,
+            max_workers=max_workers,
+        )
+
     @early_return
     def delete_webhook(
         self, webhook_id: str, verbose: Optional[bool] = False
@@ -280,6 +347,33 @@ class Webhooks:
                 )
             )
 
+    def batch_get_webhooks(
+        self,
+        webhook_ids: List[str],
+        max_workers: int = 10,
+        verbose: Optional[bool] = False,
+    ) -> List[Result[Webhook, Union[OnboardingError, AuthError]]]:
+        """
+        Returns info of several Webhooks concurrently
+        Parameters
+        ----------
+        webhook_ids
+            List of Webhook identifiers
+        max_workers
+            Maximum number of concurrent requests
+        verbose
+            Used for print service response as well as the time elapsed
+        Returns
+        -------
+            A list of Results, in the same order as webhook_ids, where if the operation is successful it returns a
+            Webhook object. Otherwise, it returns an OnboardingError or AuthError.
+        """
+        return map_concurrently(
+            lambda webhook_id: self.get_webhook(webhook_id=webhook_id, verbose=verbose),
+            webhook_ids,
+            max_workers=max_workers,
+        )
+
     @early_return
     def get_webhooks(
         self, verbose: Optional[bool] = False
@@ -301,9 +395,7 @@ class Webhooks:
         response = self.webhooks_client.get_webhooks(verbose=verbose).unwrap_or_return()
 
         if response.status_code == 200:
-            webhooks = response.json()
-            webhooks = [Webhook.from_dict(webhook) for webhook in webhooks]
-            return Success(webhooks)
+            return Success(list(map(Webhook.from_dict, response.json())))
         else:
             return Failure(
                 OnboardingError.from_response(
@@ -311,6 +403,49 @@ class Webhooks:
                 )
             )
 
+    @early_return
+    def get_webhooks_by_ids(
+        self, webhook_ids: List[str], verbose: Optional[bool] = False
+    ) -> Result[List[Webhook], Union[OnboardingError, AuthError]]:
+        """
+        Returns info of the given Webhooks with a single request
+
+        All configured webhooks are retrieved at once and filtered locally, so this is preferred over
+        batch_get_webhooks unless webhook_ids is a small subset of a large number of configured webhooks.
+
+        Parameters
+        ----------
+        webhook_ids
+            List of Webhook identifiers
+        verbose
+            Used for print service response as well as the time elapsed
+
+        Returns
+        -------
+            A Result where if the operation is successful it returns a list of Webhook objects, in the same order as
+            webhook_ids and skipping those not found. Otherwise, it returns an OnboardingError or AuthError.
+        """
+        verbose = self.verbose or verbose
+        response = self.webhooks_client.get_webhooks(verbose=verbose).unwrap_or_return()
+
+        if response.status_code == 200:
+            webhooks = {
+                webhook.get("webhook_id"): webhook for webhook in response.json()
+            }
+            return Success(
+                [
+                    Webhook.from_dict(webhooks[webhook_id])
+                    for webhook_id in webhook_ids
+                    if webhook_id in webhooks
+                ]
+            )
+        else:
+            return Failure(
+                OnboardingError.from_response(
+                    operation="get_webhooks_by_ids", response=response
+                )
+            )
+
     @early_return
     def get_webhook_results(
         self, webhook_id: str, verbose: Optional[bool] = False
@@ -1,12 +1,13 @@
 import platform
 from typing import Any, Dict, Optional, Union
 
-from meiga import Result, Success, early_return
+import requests
+from meiga import Error, Failure, Result, Success, early_return
 from requests import Response, Session
 
 import alice
 from alice.auth.auth import Auth
-from alice.auth.auth_errors import AuthError
+from alice.onboarding.onboarding_errors import OnboardingError
 from alice.onboarding.tools import print_intro, print_response, print_token, timeit
 from alice.webhooks.webhook import Webhook
 
@@ -20,27 +21,39 @@ class WebhooksClient:
         session: Session,
         url: str = DEFAULT_URL,
         send_agent: bool = True,
+        timeout: Union[float, None] = None,
     ):
         self.auth = auth
         self.url = url
+        self.timeout = timeout
         self.send_agent = send_agent
         self.session = session
-
-    def _auth_headers(self, token: str) -> Dict[str, Any]:
-        auth_headers = {"Authorization": f"Bearer {token}"}
-        if self.send_agent:
-            auth_headers.update(
-                {
-                    "Alice-User-Agent": f"onboarding-python/{alice.__version__} ({platform.system()}; {platform.release()}) python {platform.python_version()}"
-                }
-            )
-        return auth_headers
+        self._user_agent = f"onboarding-python/{alice.__version__} ({platform.system()}; {platform.release()}) python {platform.python_version()}"
+        self._agent_headers = {"Alice-User-Agent": self._user_agent}
+        self._url_webhook = f"{url}/webhook"
+        self._url_webhooks = f"{url}/webhooks"
+        self._url_webhook_subscriptable_events = f"{url}/webhook/subscriptable/events"
+        self._url_webhook_results = f"{url}/webhook/results"
+        self._url_webhook_result = f"{url}/webhook/result"
+
+    def _auth_headers(
+        self, token: str, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        # send_agent is read on every call so it can still be toggled on an existing client
+        agent_headers = self._agent_headers if self.send_agent else {}
+        if extra_headers:
+            return {
+                "Authorization": "Bearer " + token,
+                **agent_headers,
+                **extra_headers,
+            }
+        return {"Authorization": "Bearer " + token, **agent_headers}
 
     @early_return
     @timeit
     def get_subscriptable_events(
         self, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Get public subscriptable events.
@@ -60,9 +73,16 @@ class WebhooksClient:
         backend_token = self.auth.create_backend_token().unwrap_or_return()
         print_token("backend_token_with_user", backend_token, verbose=verbose)
         headers = self._auth_headers(backend_token)
-        response = self.session.get(
-            self.url + "/webhook/subscriptable/events", headers=headers
-        )
+        try:
+            response = self.session.get(
+                self._url_webhook_subscriptable_events,
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(
+                OnboardingError.timeout(operation="get_subscriptable_events")
+            )
 
         print_response(response=response, verbose=verbose)
 
@@ -72,7 +92,7 @@ class WebhooksClient:
     @timeit
     def create_webhook(
         self, webhook: Union[Webhook, None] = None, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
         It creates a new Webhook in the onboarding service.
 
@@ -94,15 +114,21 @@ class WebhooksClient:
 
         print_token("backend_token", backend_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_token)
-        headers["Content-Type"] = "application/json"
+        headers = self._auth_headers(
+            backend_token, {"Content-Type": "application/json"}
+        )
 
         data = None
         if webhook:
             data = data if data is not None else {}
             data.update(webhook.to_dict())
 
-        response = self.session.post(self.url + "/webhook", headers=headers, json=data)
+        try:
+            response = self.session.post(
+                self._url_webhook, headers=headers, json=data, timeout=self.timeout
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="create_webhook"))
 
         print_response(response=response, verbose=verbose)
 
@@ -112,7 +138,7 @@ class WebhooksClient:
     @timeit
     def update_webhook(
         self, webhook: Webhook, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Update an existent Webhook
@@ -134,17 +160,24 @@ class WebhooksClient:
         backend_token = self.auth.create_backend_token().unwrap_or_return()
         print_token("backend_token_with_user", backend_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_token)
-        headers["Content-Type"] = "application/json"
+        headers = self._auth_headers(
+            backend_token, {"Content-Type": "application/json"}
+        )
 
         data = None
         if webhook:
             data = data if data is not None else {}
             data.update(webhook.to_dict())
 
-        response = self.session.put(
-            self.url + f"/webhook/{webhook.webhook_id}", headers=headers, json=data
-        )
+        try:
+            response = self.session.put(
+                f"{self._url_webhook}/{webhook.webhook_id}",
+                headers=headers,
+                json=data,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="update_webhook"))
 
         print_response(response=response, verbose=verbose)
 
@@ -154,7 +187,7 @@ class WebhooksClient:
     @timeit
     def update_webhook_activation(
         self, webhook_id: str, active: bool, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Update Webhook activation
@@ -177,15 +210,22 @@ class WebhooksClient:
         backend_token = self.auth.create_backend_token().unwrap_or_return()
         print_token("backend_token_with_user", backend_token, verbose=verbose)
 
-        headers = self._auth_headers(backend_token)
-        headers["Content-Type"] = "application/json"
-
-        response = self.session.patch(
-            self.url + f"/webhook/{webhook_id}",
-            headers=headers,
-            json={"active": active},
+        headers = self._auth_headers(
+            backend_token, {"Content-Type": "application/json"}
         )
 
+        try:
+            response = self.session.patch(
+                f"{self._url_webhook}/{webhook_id}",
+                headers=headers,
+                json={"active": active},
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(
+                OnboardingError.timeout(operation="update_webhook_activation")
+            )
+
         print_response(response=response, verbose=verbose)
 
         return Success(response)
@@ -194,7 +234,7 @@ class WebhooksClient:
     @timeit
     def ping_webhook(
         self, webhook_id: str, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Send ping event to configured and active Webhook
@@ -217,9 +257,14 @@ class WebhooksClient:
         print_token("backend_token_with_user", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        response = self.session.post(
-            self.url + f"/webhook/{webhook_id}/ping", headers=headers
-        )
+        try:
+            response = self.session.post(
+                f"{self._url_webhook}/{webhook_id}/ping",
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="ping_webhook"))
 
         print_response(response=response, verbose=verbose)
 
@@ -229,7 +274,7 @@ class WebhooksClient:
     @timeit
     def delete_webhook(
         self, webhook_id: str, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Remove a configured Webhook
@@ -252,9 +297,14 @@ class WebhooksClient:
         print_token("backend_token_with_user", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        response = self.session.delete(
-            self.url + f"/webhook/{webhook_id}", headers=headers
-        )
+        try:
+            response = self.session.delete(
+                f"{self._url_webhook}/{webhook_id}",
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="delete_webhook"))
 
         print_response(response=response, verbose=verbose)
 
@@ -264,7 +314,7 @@ class WebhooksClient:
     @timeit
     def get_webhook(
         self, webhook_id: str, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Returns Webhook info
@@ -288,9 +338,14 @@ class WebhooksClient:
 
         headers = self._auth_headers(user_token)
 
-        response = self.session.get(
-            self.url + f"/webhook/{webhook_id}", headers=headers
-        )
+        try:
+            response = self.session.get(
+                f"{self._url_webhook}/{webhook_id}",
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="get_webhook"))
 
         print_response(response=response, verbose=verbose)
 
@@ -298,9 +353,7 @@ class WebhooksClient:
 
     @early_return
     @timeit
-    def get_webhooks(
-        self, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    def get_webhooks(self, verbose: Optional[bool] = False) -> Result[Response, Error]:
         """
 
         Returns all configured webhooks
@@ -321,7 +374,12 @@ class WebhooksClient:
         print_token("backend_token", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        response = self.session.get(self.url + "/webhooks", headers=headers)
+        try:
+            response = self.session.get(
+                self._url_webhooks, headers=headers, timeout=self.timeout
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="get_webhooks"))
 
         print_response(response=response, verbose=verbose)
 
@@ -331,7 +389,7 @@ class WebhooksClient:
     @timeit
     def get_webhook_results(
         self, webhook_id: str, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Returns all the result of delivered events from a specific Webhook
@@ -354,9 +412,14 @@ class WebhooksClient:
         print_token("backend_token", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        response = self.session.get(
-            self.url + f"/webhook/results/{webhook_id}", headers=headers
-        )
+        try:
+            response = self.session.get(
+                f"{self._url_webhook_results}/{webhook_id}",
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="get_webhook_results"))
 
         print_response(response=response, verbose=verbose)
 
@@ -366,7 +429,7 @@ class WebhooksClient:
     @timeit
     def get_last_webhook_result(
         self, webhook_id: str, verbose: Optional[bool] = False
-    ) -> Result[Response, AuthError]:
+    ) -> Result[Response, Error]:
         """
 
         Returns last result of delivered event from a specific Webhook
@@ -389,9 +452,14 @@ class WebhooksClient:
         print_token("backend_token", backend_token, verbose=verbose)
 
         headers = self._auth_headers(backend_token)
-        response = self.session.get(
-            self.url + f"/webhook/result/{webhook_id}/last", headers=headers
-        )
+        try:
+            response = self.session.get(
+                f"{self._url_webhook_result}/{webhook_id}/last",
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.Timeout:
+            return Failure(OnboardingError.timeout(operation="get_last_webhook_result"))
 
         print_response(response=response, verbose=verbose)
 
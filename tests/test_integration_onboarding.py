@@ -21,6 +21,17 @@ def test_should_return_an_error_when_the_api_key_is_not_configured():
     result.assert_failure()
 
 
+@pytest.mark.unit
+def test_should_configure_the_session_from_config():
+    config = Config(pool_maxsize=32, max_retries=2)
+    onboarding = Onboarding.from_config(config)
+
+    adapter = onboarding.onboarding_client.session.get_adapter(config.onboarding_url)
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 2
+
+
 @pytest.mark.unit
 def test_should_timeout_when_time_exceeded(
     given_valid_api_key, given_any_selfie_image_media_data
@@ -108,6 +119,12 @@ def test_should_do_complete_onboarding_process(
         user_state = onboarding.get_user_state(user_id=user_id).unwrap_or_return()
         assert user_state == UserState.REJECTED
 
+        user_states = onboarding.batch_get_user_states(user_ids=[user_id, user_id])
+        assert [result.unwrap() for result in user_states] == [
+            UserState.REJECTED,
+            UserState.REJECTED,
+        ]
+
         onboarding.delete_user(user_id).unwrap_or_return()
 
         return Success(report)
@@ -115,3 +132,25 @@ def test_should_do_complete_onboarding_process(
     result = do_complete_onboarding()
 
     result.assert_success(value_is_instance_of=Report)
+
+
+@pytest.mark.unit
+def test_should_create_users_in_bulk(given_valid_api_key):
+    config = Config(api_key=given_valid_api_key)
+    onboarding = Onboarding.from_config(config)
+
+    results = onboarding.batch_create_users(
+        user_infos=[
+            UserInfo(first_name="Alice", last_name="Biometrics"),
+            UserInfo(first_name="Bob", last_name="Biometrics"),
+        ],
+        device_infos=[
+            DeviceInfo(device_platform="Android"),
+            DeviceInfo(device_platform="iOS"),
+        ],
+    )
+
+    assert len(results) == 2
+    for result in results:
+        result.assert_success(value_is_instance_of=str)
+        onboarding.delete_user(result.unwrap()).assert_success()
@@ -14,6 +14,17 @@ def test_should_return_an_error_when_the_sandbox_token_is_not_configured():
     assert_failure(result)
 
 
+@pytest.mark.unit
+def test_should_configure_the_session_from_config():
+    config = Config(sandbox_token="sandbox_token", pool_maxsize=32, max_retries=2)
+    sandbox = Sandbox.from_config(config)
+
+    adapter = sandbox.sandbox_client.session.get_adapter(config.sandbox_url)
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 2
+
+
 @pytest.mark.unit
 def test_should_create_a_user_and_get_user_token_and_delete_it(
     given_valid_sandbox_token, given_any_valid_mail
@@ -32,3 +43,22 @@ def test_should_create_a_user_and_get_user_token_and_delete_it(
 
     result_delete_user = sandbox.delete_user(email=given_any_valid_mail)
     assert_success(result_delete_user)
+
+
+@pytest.mark.unit
+def test_should_create_and_delete_users_in_bulk(
+    given_valid_sandbox_token, given_any_valid_mail
+):
+    config = Config(sandbox_token=given_valid_sandbox_token)
+    sandbox = Sandbox.from_config(config)
+    emails = [f"{index}{given_any_valid_mail}" for index in range(2)]
+
+    results_create = sandbox.batch_create_users(
+        user_infos=[UserInfo(email=email) for email in emails]
+    )
+    for result in results_create:
+        assert_success(result)
+
+    results_delete = sandbox.batch_delete_users(emails=emails)
+    for result in results_delete:
+        assert_success(result)
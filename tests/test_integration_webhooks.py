@@ -18,6 +18,19 @@ def test_should_return_an_error_when_the_api_key_is_not_configured():
     assert_failure(result)
 
 
+@pytest.mark.unit
+def test_should_configure_a_shared_session_from_config():
+    config = Config(pool_maxsize=32, max_retries=2)
+    webhooks = Webhooks.from_config(config)
+
+    session = webhooks.webhooks_client.session
+    adapter = session.get_adapter(config.onboarding_url)
+
+    assert webhooks.webhooks_client.auth._auth_client.session is session
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 2
+
+
 @pytest.mark.unit
 def test_should_execute_all_webhook_lifecycle(given_valid_api_key):
     config = Config(api_key=given_valid_api_key)
@@ -58,6 +71,8 @@ def test_should_execute_all_webhook_lifecycle(given_valid_api_key):
     assert not retrieved_webhook.active
 
     # Update Webhook activation
+    results = webhooks_client.batch_update_webhooks_activation({webhook_id: False})
+    assert_success(results[webhook_id])
     result = webhooks_client.update_webhook_activation(webhook_id, True)
     assert_success(result)
     retrieved_webhook = webhooks_client.get_webhook(webhook_id).unwrap()
@@ -76,6 +91,15 @@ def test_should_execute_all_webhook_lifecycle(given_valid_api_key):
     result = webhooks_client.get_webhooks()
     assert_success(result, value_is_instance_of=list)
 
+    # Ping and retrieve several webhooks concurrently
+    for result in webhooks_client.batch_ping_webhooks([webhook_id]):
+        assert_success(result)
+    for result in webhooks_client.batch_get_webhooks([webhook_id]):
+        assert_success(result, value_is_instance_of=Webhook)
+    result = webhooks_client.get_webhooks_by_ids([webhook_id, "unknown"])
+    assert_success(result)
+    assert [webhook.webhook_id for webhook in result.value] == [webhook_id]
+
     sleep(2.0)
 
     # Retrieve las webhook result of an specific webhook
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import jwt
+import pytest
+from requests import Response, Session
+
+from alice.auth.auth_client import AuthClient
+from alice.onboarding.tools import map_concurrently
+
+
+def generate_dummy_token(expired: bool = False) -> str:
+    delta = timedelta(minutes=-60) if expired else timedelta(minutes=60)
+    exp = (datetime.now(timezone.utc) + delta).timestamp()
+    return jwt.encode({"exp": exp}, "secret", algorithm="HS256")
+
+
+def generate_token_response(token: str) -> Response:
+    response = Mock(spec=Response)
+    response.json.return_value = {"token": token}
+    response.status_code = 200
+    return response
+
+
+@pytest.mark.unit
+class TestAuthClient:
+    def setup_method(self):
+        self.session = Mock(spec=Session)
+        self.auth_client = AuthClient(
+            url="https://apis.alicebiometrics.com/onboarding",
+            api_key="api_key",
+            session=self.session,
+        )
+
+    def should_request_the_global_backend_token_once_when_called_concurrently(
+        self,
+    ):
+        backend_token = generate_dummy_token()
+        self.session.get.side_effect = lambda url, **kwargs: generate_token_response(
+            backend_token if url.endswith("/backend_token") else generate_dummy_token()
+        )
+
+        responses = map_concurrently(
+            lambda _: self.auth_client.create_backend_token(), range(8), max_workers=8
+        )
+
+        assert [response.json()["token"] for response in responses] == [
+            backend_token
+        ] * 8
+        backend_token_calls = [
+            call
+            for call in self.session.get.call_args_list
+            if call.args[0].endswith("/backend_token")
+        ]
+        assert len(backend_token_calls) == 1
+
+    def should_request_a_new_global_backend_token_when_cached_one_expired(self):
+        expired_token = generate_dummy_token(expired=True)
+        valid_token = generate_dummy_token()
+        self.session.get.side_effect = [
+            generate_token_response(generate_dummy_token()),
+            generate_token_response(expired_token),
+            generate_token_response(valid_token),
+        ]
+
+        first = self.auth_client.create_backend_token()
+        second = self.auth_client.create_backend_token()
+
+        assert first.json()["token"] == expired_token
+        assert second.json()["token"] == valid_token
+
+    def should_reuse_the_login_token_until_it_expires(self):
+        login_tokens = [generate_dummy_token(expired=True), generate_dummy_token()]
+        self.session.get.side_effect = lambda url, **kwargs: generate_token_response(
+            login_tokens.pop(0)
+            if url.endswith("/login_token")
+            else generate_dummy_token()
+        )
+
+        for user_id in ["user_1", "user_2", "user_3"]:
+            self.auth_client.create_user_token(user_id)
+
+        login_token_calls = [
+            call
+            for call in self.session.get.call_args_list
+            if call.args[0].endswith("/login_token")
+        ]
+        assert len(login_token_calls) == 2
@@ -0,0 +1,24 @@
+import pytest
+
+from alice.onboarding.batch import map_users_concurrently
+from alice.onboarding.models.device_info import DeviceInfo
+from alice.onboarding.models.user_info import UserInfo
+
+
+@pytest.mark.unit
+class TestBatch:
+    def should_map_users_concurrently_pairing_device_infos(self):
+        user_infos = [UserInfo(first_name="Alice"), UserInfo(first_name="Bob")]
+
+        results = map_users_concurrently(
+            lambda user_info, device_info: (user_info.first_name, device_info),
+            user_infos,
+        )
+
+        assert results == [("Alice", None), ("Bob", None)]
+        with pytest.raises(ValueError):
+            map_users_concurrently(
+                lambda user_info, device_info: None,
+                user_infos,
+                [DeviceInfo(device_platform="Android")],
+            )
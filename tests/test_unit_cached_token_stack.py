@@ -51,8 +51,11 @@ class TestCachedTokenStack:
         stack = CachedTokenStack()
 
         for i in range(4):
-            stack._data[str(i)] = generate_dummy_token(
-                payload_value=f"payload_value_{str(i)}", expired=True
+            stack.add(
+                str(i),
+                generate_dummy_token(
+                    payload_value=f"payload_value_{str(i)}", expired=True
+                ),
             )
 
         assert len(stack) == 4
@@ -69,3 +72,10 @@ class TestCachedTokenStack:
 
         token = stack.get(str(i))  # this forces clear
         assert len(stack) == 6
+
+    def should_not_return_an_expired_token(self):
+        stack = CachedTokenStack()
+
+        stack.add("key", generate_dummy_token(expired=True))
+
+        assert stack.get("key") is None
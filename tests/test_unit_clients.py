@@ -0,0 +1,58 @@
+import weakref
+from unittest.mock import Mock, patch
+
+import pytest
+from requests import Session
+
+from alice.config import DEFAULT_MAX_RETRIES, DEFAULT_POOL_MAXSIZE
+from alice.onboarding.onboarding_client import OnboardingClient
+from alice.webhooks.webhooks import Webhooks
+from alice.webhooks.webhooks_client import WebhooksClient
+
+
+@pytest.mark.unit
+class TestClients:
+    @pytest.mark.parametrize("client_class", [OnboardingClient, WebhooksClient])
+    def should_honour_send_agent_changes_on_an_existing_client(self, client_class):
+        client = client_class(auth=Mock(), session=Mock(spec=Session))
+
+        assert "Alice-User-Agent" in client._auth_headers("token")
+
+        client.send_agent = False
+
+        assert client._auth_headers("token", {"Content-Type": "application/json"}) == {
+            "Authorization": "Bearer token",
+            "Content-Type": "application/json",
+        }
+
+    def should_keep_positional_webhooks_arguments_order(self):
+        auth, session = Mock(), Mock(spec=Session)
+
+        client = WebhooksClient(auth, session, "https://url", False)
+        webhooks = Webhooks(auth, session, "https://url", False, True)
+
+        assert client.send_agent is False
+        assert client.timeout is None
+        assert webhooks.webhooks_client.send_agent is False
+        assert webhooks.verbose is True
+        assert webhooks.webhooks_client.timeout is None
+
+    def should_allow_patching_onboarding_client_instance_methods(self):
+        client = OnboardingClient(auth=Mock(), session=Mock(spec=Session))
+
+        with patch.object(client, "create_user") as create_user:
+            client.create_user()
+
+        create_user.assert_called_once_with()
+        assert weakref.ref(client)() is client
+
+    def should_build_tuned_session_clients_of_the_calling_class(self):
+        class CustomOnboardingClient(OnboardingClient):
+            pass
+
+        client = CustomOnboardingClient.with_tuned_session(auth=Mock())
+
+        assert isinstance(client, CustomOnboardingClient)
+        adapter = client.session.get_adapter("https://")
+        assert adapter.max_retries.total == DEFAULT_MAX_RETRIES
+        assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
@@ -0,0 +1,35 @@
+import pytest
+from requests import Response
+
+from alice.auth.auth_errors import AuthError
+from alice.onboarding.onboarding_errors import OnboardingError
+from alice.sandbox.sandbox_errors import SandboxError
+
+
+def given_response(status_code: int, content: bytes) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.mark.unit
+class TestErrors:
+    @pytest.mark.parametrize("error_class", [OnboardingError, AuthError, SandboxError])
+    def should_build_error_from_json_response(self, error_class):
+        response = given_response(404, b'{"detail": "User not found"}')
+
+        error = error_class.from_response(operation="get_user", response=response)
+
+        assert error.code == 404
+        assert error.message == {"detail": "User not found"}
+
+    @pytest.mark.parametrize("error_class", [OnboardingError, AuthError, SandboxError])
+    @pytest.mark.parametrize("content", [b"", b"Internal Server Error"])
+    def should_build_error_from_response_without_json(self, error_class, content):
+        response = given_response(500, content)
+
+        error = error_class.from_response(operation="get_user", response=response)
+
+        assert error.code == 500
+        assert error.message == {"message": "no content"}
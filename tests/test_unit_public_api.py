@@ -0,0 +1,30 @@
+import subprocess
+import sys
+
+import pytest
+
+import alice
+
+
+@pytest.mark.unit
+class TestPublicApi:
+    def should_resolve_every_public_name(self):
+        for name in alice.__all__:
+            assert getattr(alice, name).__name__ == name
+
+    def should_resolve_subpackages_as_attributes(self):
+        for name in ["auth", "config", "face", "onboarding", "sandbox", "webhooks"]:
+            assert getattr(alice, name).__name__ == f"alice.{name}"
+
+    def should_raise_attribute_error_for_unknown_names(self):
+        with pytest.raises(AttributeError):
+            alice.UnknownName
+
+    def should_not_import_subsystems_until_accessed(self):
+        code = (
+            "import sys, alice; "
+            "assert 'alice.webhooks.webhooks' not in sys.modules; "
+            "assert 'alice.sandbox.sandbox' not in sys.modules"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from alice.auth.token_tools import get_token_expiration, is_valid_token
+
+
+@pytest.mark.unit
+class TestTokenTools:
+    @pytest.mark.parametrize("minutes", [-60, 1, 60, 60 * 24 * 365])
+    def should_read_the_expiration_claim_without_verifying(self, minutes):
+        exp = int((datetime.now(timezone.utc) + timedelta(minutes=minutes)).timestamp())
+        token = jwt.encode({"exp": exp, "sub": "user"}, "secret", algorithm="HS256")
+
+        assert get_token_expiration(token) == float(exp)
+
+    def should_consider_tokens_within_the_margin_as_invalid(self):
+        exp = (datetime.now(timezone.utc) + timedelta(seconds=30)).timestamp()
+        token = jwt.encode({"exp": exp}, "secret", algorithm="HS256")
+
+        assert is_valid_token(token, margin_seconds=0)
+        assert not is_valid_token(token, margin_seconds=60)
+        assert not is_valid_token(None)
@@ -0,0 +1,86 @@
+import pytest
+from requests import Response
+
+from alice.onboarding import tools
+from alice.onboarding.tools import (
+    LOG_TRUNCATE_BYTES,
+    create_session,
+    map_concurrently,
+    multipart_encoder,
+    print_response,
+    timeit,
+)
+
+
+def given_response(content: bytes, content_type: str) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = content
+    return response
+
+
+@pytest.mark.unit
+class TestTools:
+    def should_map_concurrently_keeping_the_order(self):
+        results = map_concurrently(lambda x: x * 2, range(20), max_workers=4)
+
+        assert results == [x * 2 for x in range(20)]
+
+    def should_create_a_session_with_a_sized_pool_and_retries(self):
+        session = create_session(pool_maxsize=32, max_retries=3)
+
+        adapter = session.get_adapter("https://apis.alicebiometrics.com")
+
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.raise_on_status is False
+        assert adapter.max_retries.read is False
+        assert 429 in adapter.max_retries.status_forcelist
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    def should_only_report_elapsed_time_when_verbose(self, capsys):
+        @timeit
+        def operation(verbose: bool = False) -> str:
+            return "result"
+
+        assert operation() == "result"
+        assert capsys.readouterr().out == ""
+
+        assert operation(verbose=True) == "result"
+        assert "elapsed time" in capsys.readouterr().out
+        assert operation.__name__ == "operation"
+
+    def should_not_wrap_functions_when_quiet(self, monkeypatch):
+        monkeypatch.setattr(tools, "QUIET", True)
+
+        def operation(verbose: bool = False) -> str:
+            return "result"
+
+        assert timeit(operation) is operation
+
+    def should_stream_multipart_fields_before_files_skipping_none_values(self):
+        encoder = multipart_encoder(
+            data={"wait_for_completion": False, "category": None},
+            files={"video": ("video", b"media")},
+        )
+
+        body = encoder.to_string()
+
+        assert encoder.content_type.startswith("multipart/form-data; boundary=")
+        assert b'name="wait_for_completion"\r\n\r\nFalse' in body
+        assert b'name="category"' not in body
+        assert b'name="video"; filename="video"\r\n\r\nmedia' in body
+        assert body.index(b"wait_for_completion") < body.index(b"video")
+
+    def should_print_response_body_truncating_large_ones(self, capsys):
+        print_response(
+            given_response(b'{"user_id": "id"}\n', "application/json"), verbose=True
+        )
+        assert capsys.readouterr().out == (
+            'response 200 -> application/json \n{"user_id": "id"}\n'
+        )
+
+        large_content = b"x" * (LOG_TRUNCATE_BYTES + 1)
+        print_response(given_response(large_content, "text/plain"), verbose=True)
+        assert f"{len(large_content)} bytes, truncated" in capsys.readouterr().out
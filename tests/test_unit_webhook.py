@@ -0,0 +1,36 @@
+import pytest
+
+from alice.webhooks.webhook import Webhook
+
+
+def given_webhook(**kwargs) -> Webhook:
+    fields = dict(
+        active=True,
+        post_url="https://example.com/webhooks",
+        api_key="api_key",
+        secret="secret",
+        event_name="user_created",
+    )
+    fields.update(kwargs)
+    return Webhook(**fields)
+
+
+@pytest.mark.unit
+class TestWebhook:
+    def should_be_equal_to_its_dict_round_trip(self):
+        webhook = given_webhook(webhook_id="id", algorithm="sha256")
+
+        assert webhook == Webhook.from_dict(webhook.to_dict())
+
+    def should_be_equal_to_itself(self):
+        webhook = given_webhook()
+
+        assert webhook == webhook
+
+    def should_ignore_empty_optional_fields_on_equality(self):
+        assert given_webhook(webhook_id="", algorithm="") == given_webhook()
+
+    def should_not_be_equal_when_any_field_differs(self):
+        assert given_webhook() != given_webhook(event_version="2")
+        assert given_webhook() != given_webhook(webhook_id="id")
+        assert given_webhook() != "webhook"